@@ -1,15 +1,43 @@
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import create_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from typing import AsyncGenerator
 
+import orjson
+
 from core.config import settings
 
+def _json_serializer(obj) -> str:
+    # orjson encodes JSONB payloads (incl. UUID/datetime natively) 2-4x
+    # faster than stdlib json; matters for audit details and extra_data
+    return orjson.dumps(obj).decode()
+
 # Async engine for FastAPI
+# Pool is sized explicitly so connection setup (TCP/TLS/auth) is amortized
+# across requests instead of happening on the critical path.
 async_engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
-    future=True
+    future=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    # SQLAlchemy's compiled-SQL cache; the default 500 is tight once the
+    # taxpayer list/filter variants are counted, and evictions mean
+    # recompiling stable-shape statements on the hot path
+    query_cache_size=1200,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    connect_args={
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        # JIT compilation hurts large multi-VALUES inserts (bulk taxpayer import)
+        "server_settings": {"jit": "off"},
+    },
 )
 
 # Sync engine for Alembic
@@ -18,7 +46,10 @@ sync_engine = create_engine(settings.DATABASE_SYNC_URL)
 AsyncSessionLocal = async_sessionmaker(
     bind=async_engine,
     class_=AsyncSession,
-    expire_on_commit=False
+    expire_on_commit=False,
+    # Services flush explicitly via commit/execute; autoflush would add a
+    # hidden flush check before every query in the session
+    autoflush=False,
 )
 
 SyncSessionLocal = sessionmaker(
@@ -30,10 +61,7 @@ SyncSessionLocal = sessionmaker(
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for FastAPI routes to get async DB session"""
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
 
 def get_sync_db():
     """For Alembic migrations and sync operations"""
@@ -1,5 +1,5 @@
-from typing import Optional
-from fastapi import Depends, HTTPException, status
+from typing import Callable, Dict, FrozenSet, Optional
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,35 +11,49 @@ from api.utils.exceptions import UnauthorizedException
 security = HTTPBearer()
 
 async def get_current_user(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> User:
     """Dependency to get current authenticated user"""
+    # Middleware and sub-dependencies share the resolved user via
+    # request.state, so the token is decoded and the row fetched once.
+    cached = getattr(request.state, "user", None)
+    if cached is not None:
+        return cached
+
     if credentials.scheme.lower() != "bearer":
         raise UnauthorizedException("Invalid authentication scheme")
-    
-    return await AuthService.get_current_user(db, credentials.credentials)
 
-def require_role(required_roles: list):
-    """Dependency to require specific role(s)"""
-    async def role_checker(current_user: User = Depends(get_current_user)):
-        AuthService.require_role(current_user, required_roles)
-        return current_user
-    return role_checker
+    user = await AuthService.get_current_user(db, credentials.credentials)
+    request.state.user = user
+    return user
 
-# Role-specific dependencies
-async def require_admin(current_user: User = Depends(get_current_user)):
-    AuthService.require_role(current_user, [UserRole.ADMIN.value])
-    return current_user
+# Role sets precompiled once at import; the per-request membership test
+# becomes a single O(1) hash lookup instead of a list scan with repeated
+# .value attribute loads.
+_ADMIN_ONLY = frozenset({UserRole.ADMIN.value})
+_ACCOUNTANT_ROLES = frozenset({UserRole.ACCOUNTANT.value, UserRole.ADMIN.value})
+_EMPLOYER_ROLES = frozenset({UserRole.EMPLOYER.value, UserRole.ADMIN.value})
+_ORGANIZATION_ROLES = frozenset({UserRole.ORGANIZATION.value, UserRole.ADMIN.value})
 
-async def require_accountant(current_user: User = Depends(get_current_user)):
-    AuthService.require_role(current_user, [UserRole.ACCOUNTANT.value, UserRole.ADMIN.value])
-    return current_user
+# One checker per unique role combination, so FastAPI can dedupe the
+# get_current_user sub-dependency by callable identity across routes.
+_role_checkers: Dict[FrozenSet[str], Callable] = {}
 
-async def require_employer(current_user: User = Depends(get_current_user)):
-    AuthService.require_role(current_user, [UserRole.EMPLOYER.value, UserRole.ADMIN.value])
-    return current_user
+def require_role(required_roles):
+    """Dependency to require specific role(s)"""
+    key = frozenset(required_roles)
+    checker = _role_checkers.get(key)
+    if checker is None:
+        async def role_checker(current_user: User = Depends(get_current_user)):
+            AuthService.require_role(current_user, key)
+            return current_user
+        checker = _role_checkers[key] = role_checker
+    return checker
 
-async def require_organization(current_user: User = Depends(get_current_user)):
-    AuthService.require_role(current_user, [UserRole.ORGANIZATION.value, UserRole.ADMIN.value])
-    return current_user
\ No newline at end of file
+# Role-specific dependencies
+require_admin = require_role(_ADMIN_ONLY)
+require_accountant = require_role(_ACCOUNTANT_ROLES)
+require_employer = require_role(_EMPLOYER_ROLES)
+require_organization = require_role(_ORGANIZATION_ROLES)
\ No newline at end of file
@@ -1,24 +1,30 @@
-from sqlalchemy import Column, String, Enum, Text, DateTime, ForeignKey
+from sqlalchemy import String, DateTime, ForeignKey, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
+from datetime import datetime
+from typing import Any, Dict, Optional
+import uuid
 
 from api.v1.models.base import BaseModel
 
 class AuditLog(BaseModel):
     __tablename__ = "audit_logs"
-    
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    entity_type = Column(String(50), nullable=False)  # e.g., "taxpayer", "filing", "refund"
-    entity_id = Column(UUID(as_uuid=True), nullable=False)
-    action = Column(String(100), nullable=False)  # e.g., "create", "update", "delete", "verify"
-    details = Column(JSONB, default=dict)  # JSON payload with action details
-    
+
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"))
+    entity_type: Mapped[str] = mapped_column(String(50))  # e.g., "taxpayer", "filing", "refund"
+    entity_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True))
+    action: Mapped[str] = mapped_column(String(100))  # e.g., "create", "update", "delete", "verify"
+    # Server-side default avoids running dict() + JSON-encoding an empty
+    # payload in Python for every row that carries no details
+    details: Mapped[Dict[str, Any]] = mapped_column(JSONB, server_default=text("'{}'::jsonb"))
+
     # Request context
-    ip_address = Column(String(50), nullable=True)
-    user_agent = Column(String(500), nullable=True)
-    
+    ip_address: Mapped[Optional[str]] = mapped_column(String(50))
+    user_agent: Mapped[Optional[str]] = mapped_column(String(500))
+
     # Timestamp (more precise than created_at for audit purposes)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    
+    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
     def __repr__(self):
-        return f"<AuditLog {self.entity_type}.{self.action} by {self.user_id}>"
\ No newline at end of file
+        return f"<AuditLog {self.entity_type}.{self.action} by {self.user_id}>"
@@ -1,17 +1,28 @@
-from sqlalchemy import Column, DateTime, String, func
+from sqlalchemy import DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from datetime import datetime
+from typing import Optional
 import uuid
 
-Base = declarative_base()
+class Base(DeclarativeBase):
+    pass
 
 class BaseModel(Base):
     __abstract__ = True
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
+
+    # Mapped[...] declarations let SQLAlchemy 2.x hydrate rows through its
+    # positional fast path instead of per-attribute dict lookups
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True
+    )
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), onupdate=func.now()
+    )
+
     def to_dict(self):
         """Convert model instance to dictionary"""
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
\ No newline at end of file
+        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
@@ -1,9 +1,11 @@
-from sqlalchemy import Column, String, ForeignKey, Enum, Boolean, Date
+from sqlalchemy import String, ForeignKey, Boolean, Date, CheckConstraint, Index, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import JSONB
+from typing import Any, Dict, Optional
 import enum
+import uuid
 from datetime import date
 
 from api.v1.models.base import BaseModel
@@ -63,54 +65,93 @@ class NigerianState(str, enum.Enum):
 
 class Taxpayer(BaseModel):
     __tablename__ = "taxpayers"
-    
+
+    # Composite/partial indexes matching the TaxpayerFilter predicates used
+    # by GET /taxpayers; the partial index serves the default "not deleted"
+    # listing path without carrying deleted rows. The CHECK constraints
+    # replace Postgres ENUM types: plain strings hydrate without per-row
+    # enum lookups and bulk inserts send raw values directly.
+    __table_args__ = (
+        Index("ix_taxpayers_emp_status", "employer_id", "status"),
+        Index("ix_taxpayers_state_type", "state", "tax_type"),
+        Index(
+            "ix_taxpayers_verified",
+            "employer_id",
+            postgresql_where=text("is_verified AND status <> 'deleted'"),
+        ),
+        # Trigram index over the concatenated searchable text; lets the
+        # planner serve the 4-field substring search from an index instead
+        # of a sequential scan. Needs the pg_trgm extension (created at
+        # startup in dev alongside create_all).
+        Index(
+            "ix_taxpayers_search_trgm",
+            text(
+                "(coalesce(full_name,'') || ' ' || coalesce(business_name,'') "
+                "|| ' ' || coalesce(tin,'') || ' ' || coalesce(email,'')) gin_trgm_ops"
+            ),
+            postgresql_using="gin",
+        ),
+        CheckConstraint(
+            "state IN ({})".format(", ".join(f"'{s.value}'" for s in NigerianState)),
+            name="ck_taxpayers_state",
+        ),
+        CheckConstraint(
+            "tax_type IN ({})".format(", ".join(f"'{t.value}'" for t in TaxType)),
+            name="ck_taxpayers_tax_type",
+        ),
+        CheckConstraint(
+            "status IN ({})".format(", ".join(f"'{s.value}'" for s in TaxpayerStatus)),
+            name="ck_taxpayers_status",
+        ),
+    )
+
     # Core identity
-    full_name = Column(String(255), nullable=False)
-    tin = Column(String(50), unique=True, index=True, nullable=True)  # Tax Identification Number
-    bvn = Column(String(50), nullable=True)  # Bank Verification Number
-    nin = Column(String(50), nullable=True)  # National Identity Number
-    
+    full_name: Mapped[str] = mapped_column(String(255))
+    tin: Mapped[Optional[str]] = mapped_column(String(50), unique=True, index=True)  # Tax Identification Number
+    bvn: Mapped[Optional[str]] = mapped_column(String(50))  # Bank Verification Number
+    nin: Mapped[Optional[str]] = mapped_column(String(50))  # National Identity Number
+
     # Contact Information
-    email = Column(String(255), nullable=True)
-    phone_number = Column(String(50), nullable=True)
-    address = Column(String(500), nullable=True)
-    city = Column(String(100), nullable=True)
-    
-    # Tax Information
-    state = Column(Enum(NigerianState), nullable=False)
-    tax_type = Column(Enum(TaxType), nullable=False, default=TaxType.PAYE)
-    
+    email: Mapped[Optional[str]] = mapped_column(String(255))
+    phone_number: Mapped[Optional[str]] = mapped_column(String(50))
+    address: Mapped[Optional[str]] = mapped_column(String(500))
+    city: Mapped[Optional[str]] = mapped_column(String(100))
+
+    # Tax Information (stored as plain strings; see CHECK constraints above)
+    state: Mapped[str] = mapped_column(String(32))
+    tax_type: Mapped[str] = mapped_column(String(10), default=TaxType.PAYE.value)
+
     # Business Information (for companies)
-    business_name = Column(String(255), nullable=True)
-    rc_number = Column(String(50), nullable=True)  # Registration Certificate Number
-    business_type = Column(String(100), nullable=True)
-    industry = Column(String(100), nullable=True)
-    
+    business_name: Mapped[Optional[str]] = mapped_column(String(255))
+    rc_number: Mapped[Optional[str]] = mapped_column(String(50))  # Registration Certificate Number
+    business_type: Mapped[Optional[str]] = mapped_column(String(100))
+    industry: Mapped[Optional[str]] = mapped_column(String(100))
+
     # Employment Information (for PAYE)
-    employer_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=True)
-    employment_status = Column(String(50), nullable=True)  # employed, self-employed, unemployed, retired
-    job_title = Column(String(100), nullable=True)
-    employment_date = Column(Date, nullable=True)
-    
+    employer_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("organizations.id"))
+    employment_status: Mapped[Optional[str]] = mapped_column(String(50))  # employed, self-employed, unemployed, retired
+    job_title: Mapped[Optional[str]] = mapped_column(String(100))
+    employment_date: Mapped[Optional[date]] = mapped_column(Date)
+
     # Status & Metadata
-    status = Column(Enum(TaxpayerStatus), default=TaxpayerStatus.PENDING)
-    is_verified = Column(Boolean, default=False)
-    verification_date = Column(Date, nullable=True)
-    last_filing_date = Column(Date, nullable=True)
-    
+    status: Mapped[Optional[str]] = mapped_column(String(20), default=TaxpayerStatus.PENDING.value)
+    is_verified: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    verification_date: Mapped[Optional[date]] = mapped_column(Date)
+    last_filing_date: Mapped[Optional[date]] = mapped_column(Date)
+
     # Additional metadata
-    extra_data = Column(JSONB, default=dict)  # For flexible additional data
-    
+    extra_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, default=dict)  # For flexible additional data
+
     # Relationships
-    employer = relationship("Organization", back_populates="taxpayers")
+    employer: Mapped[Optional["Organization"]] = relationship(back_populates="taxpayers")
     # filings = relationship("Filing", back_populates="taxpayer", cascade="all, delete-orphan")
     # refund_cases = relationship("RefundCase", back_populates="taxpayer", cascade="all, delete-orphan")
     # compliance_scores = relationship("ComplianceScore", back_populates="taxpayer", cascade="all, delete-orphan")
-    
+
     # Audit fields (in addition to BaseModel fields)
-    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
-    updated_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
-    
+    created_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"))
+    updated_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"))
+
     def __repr__(self):
         return f"<Taxpayer {self.full_name} ({self.tin})>"
     
@@ -1,7 +1,9 @@
-from sqlalchemy import Column, String, ForeignKey, Enum, Boolean
+from sqlalchemy import String, ForeignKey, Enum, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from typing import List, Optional
 import enum
+import uuid
 
 from api.v1.models.base import BaseModel
 
@@ -18,36 +20,45 @@ class OrganizationType(str, enum.Enum):
 
 class User(BaseModel):
     __tablename__ = "users"
-    
-    name = Column(String(255), nullable=False)
-    email = Column(String(255), unique=True, index=True, nullable=False)
-    password_hash = Column(String(255), nullable=False)
-    role = Column(Enum(UserRole), nullable=False, default=UserRole.ACCOUNTANT)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=True)
-    is_active = Column(Boolean, default=True)
-    is_verified = Column(Boolean, default=False)
-    
+    __table_args__ = (
+        # Covers the org-scoped listing; (organization_id, id) also orders
+        # keyset pagination so page depth never degrades into a seq scan
+        Index("ix_users_org_id", "organization_id", "id"),
+        # Admin role filters scoped to an organization
+        Index("ix_users_role_org", "role", "organization_id"),
+    )
+
+    name: Mapped[str] = mapped_column(String(255))
+    email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    password_hash: Mapped[str] = mapped_column(String(255))
+    role: Mapped[UserRole] = mapped_column(Enum(UserRole), default=UserRole.ACCOUNTANT)
+    organization_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("organizations.id")
+    )
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    is_verified: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+
     # Relationships
-    organization = relationship("Organization", back_populates="users")
-    
+    organization: Mapped[Optional["Organization"]] = relationship(back_populates="users")
+
     def __repr__(self):
         return f"<User {self.email} ({self.role})>"
 
 class Organization(BaseModel):
     __tablename__ = "organizations"
-    
-    name = Column(String(255), nullable=False)
-    type = Column(Enum(OrganizationType), nullable=False)
-    state = Column(String(100), nullable=True)
-    registration_number = Column(String(100), unique=True, nullable=True)
-    tax_identification_number = Column(String(100), unique=True, nullable=True)
-    contact_email = Column(String(255), nullable=True)
-    contact_phone = Column(String(50), nullable=True)
-    address = Column(String(500), nullable=True)
-    
+
+    name: Mapped[str] = mapped_column(String(255))
+    type: Mapped[OrganizationType] = mapped_column(Enum(OrganizationType))
+    state: Mapped[Optional[str]] = mapped_column(String(100))
+    registration_number: Mapped[Optional[str]] = mapped_column(String(100), unique=True)
+    tax_identification_number: Mapped[Optional[str]] = mapped_column(String(100), unique=True)
+    contact_email: Mapped[Optional[str]] = mapped_column(String(255))
+    contact_phone: Mapped[Optional[str]] = mapped_column(String(50))
+    address: Mapped[Optional[str]] = mapped_column(String(500))
+
     # Relationships
-    users = relationship("User", back_populates="organization")
-    taxpayers = relationship("Taxpayer", back_populates="employer")
-    
+    users: Mapped[List["User"]] = relationship(back_populates="organization")
+    taxpayers: Mapped[List["Taxpayer"]] = relationship(back_populates="employer")
+
     def __repr__(self):
-        return f"<Organization {self.name} ({self.type})>"
\ No newline at end of file
+        return f"<Organization {self.name} ({self.type})>"
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.db.session import get_db
 from api.v1.services.auth_service import AuthService
-from api.v1.services.user_service import UserService
+from api.v1.services.user_service import UserService, OrganizationService
 from api.v1.dependencies import get_current_user, require_role
 from api.v1.schemas.user import (
     LoginRequest,
@@ -20,6 +21,24 @@ from api.v1.models.user import User
 
 auth_router = APIRouter(prefix="/auth", tags=["authentication"])
 
+def _user_to_dict(user: User) -> dict:
+    """Plain-dict projection of the UserResponse shape for hot endpoints.
+
+    The ORM row is already typed, so building the dict by hand skips the
+    Pydantic validate+dump round; orjson serializes the UUID, datetime
+    and enum values natively.
+    """
+    return {
+        "id": user.id,
+        "name": user.name,
+        "email": user.email,
+        "role": user.role,
+        "organization_id": user.organization_id,
+        "is_active": user.is_active,
+        "is_verified": user.is_verified,
+        "created_at": user.created_at,
+    }
+
 @auth_router.post("/login", response_model=Token)
 async def login(
     login_data: LoginRequest,
@@ -27,11 +46,13 @@ async def login(
 ):
     """Authenticate user and return JWT token"""
     result = await AuthService.login(db, login_data)
-    return {
+    # Returning a Response directly skips FastAPI's validation pass over
+    # the payload; response_model=Token is kept for the OpenAPI schema.
+    return ORJSONResponse({
         "access_token": result["access_token"],
         "token_type": result["token_type"],
-        "user": UserResponse.model_validate(result["user"])
-    }
+        "user": _user_to_dict(result["user"])
+    })
 
 @auth_router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
@@ -48,8 +69,6 @@ async def register_with_organization(
     db: AsyncSession = Depends(get_db)
 ):
     """Register an organization with an admin user"""
-    from api.v1.services.user_service import OrganizationService
-    
     # Create organization first
     org_data = data.model_dump(exclude={"admin_user"})
     organization = await OrganizationService.create(db, OrganizationCreate(**org_data))
@@ -71,7 +90,9 @@ async def get_current_user_info(
     current_user: User = Depends(get_current_user)
 ):
     """Get current authenticated user's information"""
-    return UserResponse.model_validate(current_user)
+    # Hot path: hand orjson the dict directly instead of letting FastAPI
+    # re-validate the model against response_model
+    return ORJSONResponse(_user_to_dict(current_user))
 
 @auth_router.put("/me", response_model=UserResponse)
 async def update_current_user(
@@ -1,4 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
 import uuid
@@ -13,6 +16,7 @@ from api.v1.schemas.taxpayer import (
     TaxpayerResponse,
     TaxpayerDetailResponse,
     TaxpayerFilter,
+    TaxpayerListItem,
     TaxpayerListResponse,
     TaxpayerBulkCreate,
     TaxpayerImportResult,
@@ -22,6 +26,11 @@ from api.utils.exceptions import NotFoundException, BadRequestException
 
 taxpayers_router = APIRouter(prefix="/taxpayers", tags=["taxpayers"])
 
+# Validates a whole page of rows in one pydantic-core call instead of
+# one model_validate per row; schema compilation happens once at import
+_TAXPAYER_LIST_ADAPTER = TypeAdapter(List[TaxpayerResponse])
+_TAXPAYER_PAGE_ADAPTER = TypeAdapter(List[TaxpayerListItem])
+
 @taxpayers_router.post("", response_model=TaxpayerResponse, status_code=status.HTTP_201_CREATED)
 async def create_taxpayer(
     taxpayer_data: TaxpayerCreate,
@@ -70,13 +79,42 @@ async def get_taxpayers(
     pages = (total + size - 1) // size  # Ceiling division
     
     return TaxpayerListResponse(
-        items=[TaxpayerResponse.model_validate(tp) for tp in taxpayers],
+        items=_TAXPAYER_PAGE_ADAPTER.validate_python(taxpayers, from_attributes=True),
         total=total,
         page=page,
         size=size,
         pages=pages
     )
 
+@taxpayers_router.get("/export")
+async def export_taxpayers(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    state: Optional[str] = Query(None, description="Filter by state"),
+    tax_type: Optional[str] = Query(None, description="Filter by tax type"),
+    status: Optional[TaxpayerStatus] = Query(None, description="Filter by status"),
+    employer_id: Optional[uuid.UUID] = Query(None, description="Filter by employer"),
+    is_verified: Optional[bool] = Query(None, description="Filter by verification status"),
+    search: Optional[str] = Query(None, description="Search in name, TIN, or business name")
+):
+    """Stream taxpayers as NDJSON (one row per line), unpaginated"""
+    filter_data = TaxpayerFilter(
+        state=state,
+        tax_type=tax_type,
+        status=status,
+        employer_id=employer_id,
+        is_verified=is_verified,
+        search=search
+    )
+
+    async def ndjson_rows():
+        # Rows stream off a server-side cursor; memory stays bounded no
+        # matter how many taxpayers the filter matches
+        async for row in TaxpayerService.stream_all(db, filter_data, current_user):
+            yield orjson.dumps(dict(row._mapping)) + b"\n"
+
+    return StreamingResponse(ndjson_rows(), media_type="application/x-ndjson")
+
 @taxpayers_router.get("/{taxpayer_id}", response_model=TaxpayerDetailResponse)
 async def get_taxpayer(
     taxpayer_id: uuid.UUID,
@@ -91,15 +129,13 @@ async def get_taxpayer(
     
     # Convert to response model
     response = TaxpayerDetailResponse.model_validate(taxpayer)
-    
-    # Add related counts (these would come from separate queries/services)
-    # For now, we'll add placeholder values
-    response.filing_count = len(taxpayer.filings) if taxpayer.filings else 0
-    response.active_refund_cases = sum(
-        1 for rc in taxpayer.refund_cases 
-        if rc.status in ["initiated", "under_review"]  # You'll define these statuses later
-    ) if taxpayer.refund_cases else 0
-    
+
+    # Counts come back as two integers from a SQL aggregate instead of
+    # materializing whole related collections just to measure them
+    response.filing_count, response.active_refund_cases = (
+        await TaxpayerService.get_related_counts(db, taxpayer_id)
+    )
+
     return response
 
 @taxpayers_router.put("/{taxpayer_id}", response_model=TaxpayerResponse)
@@ -146,7 +182,7 @@ async def bulk_create_taxpayers(
     )
     
     return TaxpayerImportResult(
-        successful=[TaxpayerResponse.model_validate(tp) for tp in successful],
+        successful=_TAXPAYER_LIST_ADAPTER.validate_python(successful, from_attributes=True),
         failed=failed,
         total_processed=len(bulk_data.taxpayers),
         successful_count=len(successful),
@@ -188,18 +224,11 @@ async def search_by_tin(
     current_user: User = Depends(get_current_user)
 ):
     """Search for taxpayer by TIN"""
-    taxpayer = await TaxpayerService.get_by_tin(db, tin)
-    
+    # Authorization is applied inside the query; an out-of-scope TIN is
+    # indistinguishable from a missing one
+    taxpayer = await TaxpayerService.get_by_tin(db, tin, current_user)
+
     if not taxpayer:
         raise NotFoundException(f"No taxpayer found with TIN {tin}")
-    
-    # Check permissions
-    if current_user.role.value != "ADMIN":
-        if current_user.role.value in ["ACCOUNTANT", "EMPLOYER"]:
-            if taxpayer.employer_id != current_user.organization_id:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="You don't have permission to view this taxpayer"
-                )
-    
+
     return TaxpayerDetailResponse.model_validate(taxpayer)
\ No newline at end of file
@@ -22,6 +22,7 @@ from api.v1.schemas.taxpayer import (
     TaxpayerResponse,
     TaxpayerDetailResponse,
     TaxpayerFilter,
+    TaxpayerListItem,
     TaxpayerListResponse,
     TaxpayerBulkCreate,
     TaxpayerImportResult,
@@ -54,6 +55,7 @@ __all__ = [
     "TaxpayerResponse",
     "TaxpayerDetailResponse",
     "TaxpayerFilter",
+    "TaxpayerListItem",
     "TaxpayerListResponse",
     "TaxpayerBulkCreate",
     "TaxpayerImportResult",
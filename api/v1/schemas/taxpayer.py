@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field, EmailStr, validator, ConfigDict
+from pydantic import BaseModel, Field, EmailStr, ConfigDict, field_validator, model_validator
 from typing import Optional, List, Dict, Any
 from datetime import date, datetime
+import re
 import uuid
 from enum import Enum
 
@@ -59,8 +60,17 @@ class NigerianState(str, Enum):
     YOBE = "Yobe"
     ZAMFARA = "Zamfara"
 
+# Compiled once at import; used for phone-number digit counting
+_NON_DIGITS = re.compile(r'\D')
+
+_COMPANY_TAX_TYPES = frozenset({TaxType.CIT, TaxType.VAT, TaxType.WHT})
+
 # Base schemas
 class TaxpayerBase(BaseModel):
+    # use_enum_values keeps enum parsing inside pydantic-core and stores the
+    # plain string, so bulk imports skip per-row Python enum reconstruction
+    model_config = ConfigDict(use_enum_values=True, str_strip_whitespace=True)
+
     full_name: str = Field(..., min_length=2, max_length=255)
     tin: Optional[str] = Field(None, max_length=50, pattern=r'^\d{10,12}$')
     bvn: Optional[str] = Field(None, max_length=50, pattern=r'^\d{11}$')
@@ -90,42 +100,32 @@ class TaxpayerBase(BaseModel):
     # Additional metadata
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
     
-    @validator('tin')
-    def validate_tin(cls, v):
-        if v is not None:
-            # Basic TIN validation (Nigeria TIN is usually 10-12 digits)
-            if not v.isdigit() or len(v) < 10 or len(v) > 12:
-                raise ValueError('TIN must be 10-12 digits')
-        return v
-    
-    @validator('phone_number')
+    # TIN format (10-12 digits) is fully enforced by the field pattern,
+    # which pydantic-core compiles once; no Python-level validator needed.
+
+    @field_validator('phone_number', mode='after')
+    @classmethod
     def validate_phone_number(cls, v):
         if v is not None:
-            # Remove all non-digit characters for validation
-            digits = ''.join(filter(str.isdigit, v))
-            if len(digits) < 10:
+            if len(_NON_DIGITS.sub('', v)) < 10:
                 raise ValueError('Phone number must have at least 10 digits')
         return v
 
 # Create schemas
 class TaxpayerCreate(TaxpayerBase):
     employer_id: Optional[uuid.UUID] = None
-    
-    @validator('business_name')
-    def validate_business_name(cls, v, values):
-        if values.get('tax_type') in [TaxType.CIT, TaxType.VAT, TaxType.WHT]:
-            if not v:
-                raise ValueError('Business name is required for company tax types')
-        return v
-    
-    @validator('employment_status')
-    def validate_employment_for_paye(cls, v, values):
-        if values.get('tax_type') == TaxType.PAYE:
-            if not v:
-                raise ValueError('Employment status is required for PAYE taxpayers')
-        return v
+
+    @model_validator(mode='after')
+    def validate_tax_type_requirements(self):
+        if self.tax_type in _COMPANY_TAX_TYPES and not self.business_name:
+            raise ValueError('Business name is required for company tax types')
+        if self.tax_type == TaxType.PAYE and not self.employment_status:
+            raise ValueError('Employment status is required for PAYE taxpayers')
+        return self
 
 class TaxpayerUpdate(BaseModel):
+    model_config = ConfigDict(use_enum_values=True, str_strip_whitespace=True)
+
     full_name: Optional[str] = Field(None, min_length=2, max_length=255)
     email: Optional[EmailStr] = None
     phone_number: Optional[str] = Field(None, max_length=50, pattern=r'^\+?[\d\s\-\(\)]{7,}$')
@@ -167,8 +167,26 @@ class TaxpayerDetailResponse(TaxpayerResponse):
     active_refund_cases: int = 0
     current_compliance_score: Optional[float] = None
 
+class TaxpayerListItem(BaseModel):
+    """Slim row shape for list pages: only the hot columns are selected,
+    so cold fields (addresses, business info, extra_data JSONB) never
+    leave the database on the listing path."""
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+
+    id: uuid.UUID
+    full_name: str
+    tin: Optional[str] = None
+    state: NigerianState
+    tax_type: TaxType
+    status: TaxpayerStatus
+    employer_id: Optional[uuid.UUID] = None
+    is_verified: bool
+    created_at: datetime
+
 # List and filter schemas
 class TaxpayerFilter(BaseModel):
+    model_config = ConfigDict(use_enum_values=True)
+
     state: Optional[NigerianState] = None
     tax_type: Optional[TaxType] = None
     status: Optional[TaxpayerStatus] = None
@@ -179,7 +197,7 @@ class TaxpayerFilter(BaseModel):
     created_before: Optional[date] = None
 
 class TaxpayerListResponse(BaseModel):
-    items: List[TaxpayerResponse]
+    items: List[TaxpayerListItem]
     total: int
     page: int
     size: int
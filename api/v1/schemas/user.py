@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 from typing import Optional
 from datetime import datetime
 import uuid
@@ -15,6 +15,29 @@ class OrganizationType(str, Enum):
     EMPLOYER = "employer"
     FINTECH = "fintech"
 
+def _validate_password_strength(v: str) -> str:
+    """Shared password policy: one pass over the string instead of four
+    any(...) scans, short-circuiting once every character class is seen."""
+    if len(v) < 8:
+        raise ValueError('Password must be at least 8 characters long')
+    has_upper = has_lower = has_digit = False
+    for c in v:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+        if has_upper and has_lower and has_digit:
+            break
+    if not has_upper:
+        raise ValueError('Password must contain at least one uppercase letter')
+    if not has_lower:
+        raise ValueError('Password must contain at least one lowercase letter')
+    if not has_digit:
+        raise ValueError('Password must contain at least one digit')
+    return v
+
 # Base schemas
 class UserBase(BaseModel):
     name: str = Field(..., min_length=2, max_length=255)
@@ -36,17 +59,10 @@ class UserCreate(UserBase):
     role: UserRole = UserRole.ACCOUNTANT
     organization_id: Optional[uuid.UUID] = None
 
-    @validator('password')
-    def validate_password(cls, v):
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not any(c.isupper() for c in v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not any(c.islower() for c in v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not any(c.isdigit() for c in v):
-            raise ValueError('Password must contain at least one digit')
-        return v
+    @field_validator('password')
+    @classmethod
+    def validate_password(cls, v: str) -> str:
+        return _validate_password_strength(v)
 
 class OrganizationCreate(OrganizationBase):
     pass
@@ -62,16 +78,14 @@ class UserResponse(UserBase):
     is_active: bool
     is_verified: bool
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 class OrganizationResponse(OrganizationBase):
     id: uuid.UUID
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 # Auth schemas
 class Token(BaseModel):
@@ -97,14 +111,7 @@ class PasswordChange(BaseModel):
     current_password: str
     new_password: str
     
-    @validator('new_password')
-    def validate_new_password(cls, v):
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not any(c.isupper() for c in v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not any(c.islower() for c in v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not any(c.isdigit() for c in v):
-            raise ValueError('Password must contain at least one digit')
-        return v
\ No newline at end of file
+    @field_validator('new_password')
+    @classmethod
+    def validate_new_password(cls, v: str) -> str:
+        return _validate_password_strength(v)
\ No newline at end of file
@@ -0,0 +1,81 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert, text
+
+from api.v1.models.audit_log import AuditLog
+
+# Audit rows are queued by request handlers and drained by a background
+# task into batched multi-row inserts, keeping the audit write off the
+# request critical path. The consumer uses its own session so audit
+# traffic never competes with request handlers for pool slots.
+_QUEUE_MAXSIZE = 10_000
+_BATCH_MAX_ROWS = 500
+_BATCH_MAX_WAIT = 0.1  # seconds to wait for a fuller batch
+
+audit_queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+
+_consumer_task: Optional[asyncio.Task] = None
+
+async def _collect_batch() -> List[Dict[str, Any]]:
+    """Block for the first row, then gather more until the batch is full
+    or the wait window elapses."""
+    rows = [await audit_queue.get()]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + _BATCH_MAX_WAIT
+
+    while len(rows) < _BATCH_MAX_ROWS:
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            rows.append(await asyncio.wait_for(audit_queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+
+    return rows
+
+async def _flush(rows: List[Dict[str, Any]]) -> None:
+    if not rows:
+        return
+    # Imported here so the module can be imported without engine config
+    from api.db.session import AsyncSessionLocal
+
+    try:
+        async with AsyncSessionLocal() as session:
+            # Audit rows are the one write where losing the last few ms on a
+            # crash is acceptable; skipping the WAL sync wait roughly doubles
+            # attainable insert throughput on this table
+            await session.execute(text("SET LOCAL synchronous_commit TO OFF"))
+            await session.execute(insert(AuditLog), rows)
+            await session.commit()
+    except Exception as e:
+        # Audit writes must never take down the consumer or the app
+        print(f"Audit log flush failed ({len(rows)} rows): {e}")
+
+async def _consume() -> None:
+    while True:
+        rows = await _collect_batch()
+        await _flush(rows)
+
+def start_audit_consumer() -> None:
+    """Start the background audit consumer (called from app startup)"""
+    global _consumer_task
+    if _consumer_task is None or _consumer_task.done():
+        _consumer_task = asyncio.create_task(_consume())
+
+async def stop_audit_consumer() -> None:
+    """Stop the consumer and flush anything still queued (app shutdown)"""
+    global _consumer_task
+    if _consumer_task is not None:
+        _consumer_task.cancel()
+        try:
+            await _consumer_task
+        except asyncio.CancelledError:
+            pass
+        _consumer_task = None
+
+    remaining: List[Dict[str, Any]] = []
+    while not audit_queue.empty():
+        remaining.append(audit_queue.get_nowait())
+    await _flush(remaining)
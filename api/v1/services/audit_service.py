@@ -1,12 +1,33 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import insert
-from datetime import datetime
+import asyncio
 import uuid
 from typing import Optional, Dict, Any
 
+from api.v1.services.audit_queue import audit_queue
 from api.v1.models.audit_log import AuditLog
 
 class AuditService:
+    @staticmethod
+    def _build_row(
+        user_id: uuid.UUID,
+        entity_type: str,
+        entity_id: uuid.UUID,
+        action: str,
+        details: Optional[Dict[str, Any]],
+        ip_address: Optional[str],
+        user_agent: Optional[str],
+    ) -> Dict[str, Any]:
+        return {
+            "user_id": user_id,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "action": action,
+            "details": details or {},
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            # timestamp comes from the column's server_default now()
+        }
+
     @staticmethod
     async def log_action(
         db: AsyncSession,
@@ -17,21 +38,41 @@ class AuditService:
         details: Optional[Dict[str, Any]] = None,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None
-    ) -> AuditLog:
-        """Log an action to the audit trail"""
-        
-        audit_log = AuditLog(
-            user_id=user_id,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            action=action,
-            details=details or {},
-            ip_address=ip_address,
-            user_agent=user_agent,
-            timestamp=datetime.utcnow()
+    ) -> None:
+        """Queue an action for the audit trail.
+
+        Fire-and-forget: the row is handed to the background consumer which
+        writes batched inserts (see audit_queue), so the request never waits
+        on the audit INSERT. If the queue is saturated the row is dropped
+        rather than stalling the request. The db argument is kept for
+        call-site compatibility.
+        """
+        row = AuditService._build_row(
+            user_id, entity_type, entity_id, action, details, ip_address, user_agent
+        )
+        try:
+            audit_queue.put_nowait(row)
+        except asyncio.QueueFull:
+            print(f"Audit queue full; dropping {action} on {entity_type} {entity_id}")
+
+    @staticmethod
+    async def log_action_sync(
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        entity_type: str,
+        entity_id: uuid.UUID,
+        action: str,
+        details: Optional[Dict[str, Any]] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None
+    ) -> None:
+        """Write the audit row in the caller's session/transaction.
+
+        For the rare case where the audit row must commit atomically with
+        the mutation it describes; the caller owns the commit.
+        """
+        row = AuditService._build_row(
+            user_id, entity_type, entity_id, action, details, ip_address, user_agent
         )
-        
-        db.add(audit_log)
-        await db.flush()  # Flush but don't commit - let the main transaction handle it
-        
-        return audit_log
\ No newline at end of file
+        db.add(AuditLog(**row))
+        await db.flush()
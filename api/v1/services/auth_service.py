@@ -1,28 +1,70 @@
 from datetime import timedelta
-from typing import Optional
+from hashlib import sha256
+from time import monotonic
+from typing import Dict, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 
 from api.v1.models.user import User
 from api.v1.schemas.user import LoginRequest, TokenData
-from core.security import verify_password, create_access_token
+from core.security import DUMMY_HASH, verify_password_async, create_access_token, decode_token
 from core.config import settings
-from api.utils.exceptions import UnauthorizedException, NotFoundException
+from api.utils.exceptions import ForbiddenException, UnauthorizedException, NotFoundException
+
+# Short-TTL cache of authenticated user rows keyed by user id. A chatty
+# SPA re-authenticates on every call; the row is near-immutable across a
+# token's lifetime, so repeat requests skip the SELECT entirely. Bounded
+# like the token-decode cache: past the cap, the oldest insertion goes.
+_USER_CACHE_MAX = 10_000
+_user_cache: Dict[str, Tuple[User, float]] = {}
+
+def invalidate_user_cache(user_id) -> None:
+    """Drop a user from the auth cache (call after updates/deactivation)"""
+    _user_cache.pop(str(user_id), None)
+
+# Recent-login cache: sha256(password || stored hash) -> expiry. Clients
+# that re-login in quick succession (JWT refresh loops) skip the ~50ms
+# Argon2 verify inside the window. Only successful verifies are cached,
+# and the key binds to the stored hash so a password change orphans it.
+_RECENT_LOGIN_TTL = 60.0
+_RECENT_LOGIN_MAX = 10_000
+_recent_logins: Dict[bytes, float] = {}
 
 class AuthService:
     @staticmethod
     async def authenticate_user(db: AsyncSession, login_data: LoginRequest) -> Optional[User]:
-        # Get user by email
-        result = await db.execute(select(User).where(User.email == login_data.email))
+        # Get user by email; lambda_stmt reuses the compiled SQL across
+        # calls so the per-login cost is just the bind value
+        email = login_data.email
+        result = await db.execute(
+            lambda_stmt(lambda: select(User).where(User.email == email))
+        )
         user = result.scalar_one_or_none()
-        
-        if not user:
-            return None
-        
-        # Check password
-        if not verify_password(login_data.password, user.password_hash):
+
+        # Unknown emails verify against DUMMY_HASH so both branches pay the
+        # same Argon2 cost; an early return here would let response timing
+        # reveal which emails have accounts
+        password_hash = user.password_hash if user is not None else DUMMY_HASH
+
+        # Check password, short-circuiting through the recent-login cache
+        digest = sha256(
+            login_data.password.encode("utf-8") + password_hash.encode("utf-8")
+        ).digest()
+        expiry = _recent_logins.get(digest)
+        if expiry is not None and monotonic() < expiry:
+            password_ok = True
+        else:
+            # Off-loop verify: concurrent logins run on worker threads
+            # instead of serializing behind one Argon2 computation
+            password_ok = await verify_password_async(login_data.password, password_hash)
+            if password_ok and user is not None:
+                if len(_recent_logins) >= _RECENT_LOGIN_MAX:
+                    del _recent_logins[next(iter(_recent_logins))]
+                _recent_logins[digest] = monotonic() + _RECENT_LOGIN_TTL
+
+        if user is None or not password_ok:
             return None
-        
+
         # Check if user is active
         if not user.is_active:
             raise UnauthorizedException("User account is inactive")
@@ -52,8 +94,6 @@ class AuthService:
         db: AsyncSession,
         token: str,
     ) -> User:
-        from core.security import decode_token
-        
         try:
             payload = decode_token(token)
             user_id: str = payload.get("sub")
@@ -67,22 +107,37 @@ class AuthService:
             )
         except Exception:
             raise UnauthorizedException("Could not validate credentials")
-        
-        # Get user from database
-        result = await db.execute(select(User).where(User.id == token_data.user_id))
+
+        # Serve from the short-TTL cache when possible
+        cached = _user_cache.get(user_id)
+        if cached is not None:
+            user, expires = cached
+            if monotonic() < expires:
+                return user
+            del _user_cache[user_id]
+
+        # Get user from database (compiled form cached; runs on every
+        # cache-miss request)
+        lookup_id = token_data.user_id
+        result = await db.execute(
+            lambda_stmt(lambda: select(User).where(User.id == lookup_id))
+        )
         user = result.scalar_one_or_none()
-        
+
         if user is None:
             raise NotFoundException("User not found")
-        
+
         if not user.is_active:
             raise UnauthorizedException("User account is inactive")
-        
+
+        if len(_user_cache) >= _USER_CACHE_MAX:
+            del _user_cache[next(iter(_user_cache))]
+        _user_cache[user_id] = (user, monotonic() + settings.AUTH_CACHE_TTL_SECONDS)
+
         return user
 
     @staticmethod
-    def require_role(user: User, required_roles: list):
-        """Check if user has required role(s)"""
+    def require_role(user: User, required_roles):
+        """Check if user has required role(s); pass a frozenset for O(1) checks"""
         if user.role.value not in required_roles:
-            from api.utils.exceptions import ForbiddenException
             raise ForbiddenException("Insufficient permissions")
\ No newline at end of file
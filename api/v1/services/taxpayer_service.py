@@ -1,13 +1,15 @@
 from typing import Optional, List, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, or_, and_
+from sqlalchemy import select, update as sa_update, func, bindparam, cast, lambda_stmt, literal_column, text
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 import uuid
-from datetime import date, datetime
+from datetime import date
+
 
 from api.v1.models.taxpayer import Taxpayer, TaxType, TaxpayerStatus, NigerianState
-from api.v1.models.user import User
+from api.v1.models.user import Organization, User, UserRole
 from api.v1.schemas.taxpayer import (
     TaxpayerCreate,
     TaxpayerUpdate,
@@ -22,439 +24,693 @@ from api.utils.exceptions import (
     ForbiddenException,
 )
 from api.v1.services.audit_service import AuditService
+from api.v1.services.user_service import OrganizationService
 
-class TaxpayerService:
-    
-    @staticmethod
-    async def get_by_id(
-        db: AsyncSession, 
-        taxpayer_id: uuid.UUID,
-        include_related: bool = False
-    ) -> Optional[Taxpayer]:
-        """Get taxpayer by ID with optional related data"""
-        query = select(Taxpayer).where(Taxpayer.id == taxpayer_id)
-        
-        if include_related:
-            query = query.options(
-                selectinload(Taxpayer.employer)
-            )
-        
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
-    
-    @staticmethod
-    async def get_by_tin(db: AsyncSession, tin: str) -> Optional[Taxpayer]:
-        """Get taxpayer by Tax Identification Number"""
-        result = await db.execute(
-            select(Taxpayer).where(Taxpayer.tin == tin)
+# Bin-pack bulk inserts under Postgres' 65535 bind-parameter limit
+_BULK_COLS_PER_ROW = len(TaxpayerCreate.model_fields) + 2  # + created_by/updated_by
+_BULK_BATCH_SIZE = 65535 // _BULK_COLS_PER_ROW
+
+# Roles whose reads/writes are scoped to their own organization; frozenset
+# membership beats list scans, and holding the enum members themselves
+# keeps the hot comparisons below on identity rather than string equality
+_ORG_SCOPED_ROLES = frozenset({UserRole.ACCOUNTANT, UserRole.EMPLOYER})
+
+# Concatenated searchable text, written to match ix_taxpayers_search_trgm's
+# indexed expression exactly so the planner can serve substring searches
+# from the trigram index
+# (literal_column keeps the '' and ' ' constants inline rather than bound
+# parameters, which the planner cannot match against an expression index)
+_EMPTY = literal_column("''")
+_SPACE = literal_column("' '")
+_SEARCH_DOC = (
+    func.coalesce(Taxpayer.full_name, _EMPTY)
+    .concat(_SPACE)
+    .concat(func.coalesce(Taxpayer.business_name, _EMPTY))
+    .concat(_SPACE)
+    .concat(func.coalesce(Taxpayer.tin, _EMPTY))
+    .concat(_SPACE)
+    .concat(func.coalesce(Taxpayer.email, _EMPTY))
+)
+
+# The slim row shape served by list endpoints (mirrors TaxpayerListItem);
+# cold columns — addresses, business info, extra_data JSONB — never leave
+# the database on the listing path
+LIST_COLUMNS = (
+    Taxpayer.id,
+    Taxpayer.full_name,
+    Taxpayer.tin,
+    Taxpayer.state,
+    Taxpayer.tax_type,
+    Taxpayer.status,
+    Taxpayer.employer_id,
+    Taxpayer.is_verified,
+    Taxpayer.created_at,
+)
+
+# Prebuilt statements for the no-filter listing — the most common request
+# shape — so the filter walk and statement construction are skipped
+# entirely; the org-scoped variant takes the organization as a bind param
+_NO_FILTER_QUERY = (
+    select(*LIST_COLUMNS, func.count().over().label("total"))
+    .where(Taxpayer.status != TaxpayerStatus.DELETED)
+    .order_by(Taxpayer.created_at.desc())
+)
+_NO_FILTER_ORG_QUERY = _NO_FILTER_QUERY.where(
+    Taxpayer.employer_id == bindparam("org_id")
+)
+
+
+async def get_by_id(
+    db: AsyncSession, 
+    taxpayer_id: uuid.UUID,
+    include_related: bool = False
+) -> Optional[Taxpayer]:
+    """Get taxpayer by ID with optional related data"""
+    # lambda_stmt caches the compiled SQL keyed on the lambda's code
+    # object; repeat calls skip statement construction and compilation
+    # entirely and only swap the bind value
+    query = lambda_stmt(lambda: select(Taxpayer).where(Taxpayer.id == taxpayer_id))
+
+    if include_related:
+        # selectinload fetches related rows eagerly in O(1) extra
+        # queries; lazy-loading them later from an async context would
+        # raise (no implicit IO). Filing/RefundCase joins go here once
+        # those models land.
+        query += lambda s: s.options(selectinload(Taxpayer.employer))
+
+    result = await db.execute(query)
+    return result.scalar_one_or_none()
+
+async def get_related_counts(
+    db: AsyncSession,
+    taxpayer_id: uuid.UUID
+) -> tuple[int, int]:
+    """Return (filing_count, active_refund_cases) for a taxpayer.
+
+    Once the Filing and RefundCase models exist this becomes a single
+    aggregate query so only two integers cross the wire, e.g.::
+
+        select(
+            func.count(Filing.id),
+            func.count().filter(
+                RefundCase.status.in_(["initiated", "under_review"])
+            ),
+        ).select_from(Taxpayer).outerjoin(Filing).outerjoin(RefundCase)
+         .where(Taxpayer.id == taxpayer_id)
+
+    Until then neither table exists, so the counts are zero.
+    """
+    return 0, 0
+
+async def get_by_tin(
+    db: AsyncSession,
+    tin: str,
+    current_user: Optional[User] = None
+) -> Optional[Taxpayer]:
+    """Get taxpayer by Tax Identification Number.
+
+    When current_user is given, the caller's authorization is part of
+    the WHERE clause: rows the user may not see return None without
+    ever being fetched or hydrated, which also closes the TIN
+    enumeration side-channel of check-after-fetch.
+    """
+    query = lambda_stmt(lambda: select(Taxpayer).where(Taxpayer.tin == tin))
+
+    if current_user is not None:
+        role = current_user.role
+        if role is not UserRole.ADMIN and role in _ORG_SCOPED_ROLES:
+            org_id = current_user.organization_id
+            query += lambda s: s.where(Taxpayer.employer_id == org_id)
+
+    result = await db.execute(query)
+    return result.scalar_one_or_none()
+
+async def create(
+    db: AsyncSession, 
+    taxpayer_data: TaxpayerCreate,
+    current_user: User
+) -> Taxpayer:
+    """Create a new taxpayer"""
+    # Verify employer exists and user has access before touching the row
+    if taxpayer_data.employer_id:
+        employer = await OrganizationService.get_by_id(db, taxpayer_data.employer_id)
+
+        if not employer:
+            raise BadRequestException(f"Organization {taxpayer_data.employer_id} not found")
+
+        # Check if current user belongs to this organization
+        if current_user.organization_id != taxpayer_data.employer_id and current_user.role is not UserRole.ADMIN:
+            raise ForbiddenException("You can only assign taxpayers to your own organization")
+
+    # One traversal of the model; the insert row and the audit payload
+    # share it (a dict copy is far cheaper than a second dump)
+    dumped = taxpayer_data.model_dump()
+    row = dict(dumped)
+    row["extra_data"] = row.pop("metadata", None) or {}
+    row["created_by"] = current_user.id
+    row["updated_by"] = current_user.id
+
+    # No preflight SELECT on the TIN: the UNIQUE index arbitrates in the
+    # same round trip as the insert, which is also race-free under
+    # concurrent creates (check-then-insert was not)
+    stmt = (
+        pg_insert(Taxpayer)
+        .values(row)
+        .on_conflict_do_nothing(index_elements=["tin"])
+        .returning(Taxpayer)
+    )
+
+    try:
+        result = await db.execute(stmt)
+        db_taxpayer = result.scalars().first()
+
+        if db_taxpayer is None:
+            await db.rollback()
+            raise ConflictException(f"Taxpayer with TIN {taxpayer_data.tin} already exists")
+
+        await db.commit()
+
+        # Log the creation
+        await AuditService.log_action(
+            db=db,
+            user_id=current_user.id,
+            entity_type="taxpayer",
+            entity_id=db_taxpayer.id,
+            action="create",
+            details={"data": dumped}
         )
-        return result.scalar_one_or_none()
-    
-    @staticmethod
-    async def create(
-        db: AsyncSession, 
-        taxpayer_data: TaxpayerCreate,
-        current_user: User
-    ) -> Taxpayer:
-        """Create a new taxpayer"""
-        # Check if TIN already exists
-        if taxpayer_data.tin:
-            existing = await TaxpayerService.get_by_tin(db, taxpayer_data.tin)
-            if existing:
-                raise ConflictException(f"Taxpayer with TIN {taxpayer_data.tin} already exists")
-        
-        # Create taxpayer instance
-        db_taxpayer = Taxpayer(
-            **taxpayer_data.model_dump(exclude={"employer_id"}),
-            created_by=current_user.id,
-            updated_by=current_user.id
+
+        return db_taxpayer
+    except IntegrityError as e:
+        await db.rollback()
+        if "unique constraint" in str(e).lower():
+            raise ConflictException("Taxpayer with these details already exists")
+        raise BadRequestException(f"Error creating taxpayer: {str(e)}")
+
+async def update(
+    db: AsyncSession,
+    taxpayer_id: uuid.UUID,
+    update_data: TaxpayerUpdate,
+    current_user: User
+) -> Taxpayer:
+    """Update an existing taxpayer"""
+    # Slim pre-read: the permission check and audit snapshot need five
+    # columns, not a fully hydrated entity
+    pre = (await db.execute(
+        select(
+            Taxpayer.employer_id,
+            Taxpayer.full_name,
+            Taxpayer.email,
+            Taxpayer.status,
+            Taxpayer.extra_data,
+        ).where(Taxpayer.id == taxpayer_id)
+    )).first()
+    if pre is None:
+        raise NotFoundException(f"Taxpayer {taxpayer_id} not found")
+
+    # Check permissions (only employer_id is consulted)
+    await _check_permissions(db, pre, current_user, "update")
+
+    # Store original data for audit
+    original_data = {
+        "full_name": pre.full_name,
+        "email": pre.email,
+        "status": pre.status,
+        "metadata": dict(pre.extra_data) if pre.extra_data else {}
+    }
+
+    update_dict = update_data.model_dump(exclude_unset=True)
+
+    values: Dict[str, Any] = dict(update_dict)
+    metadata = values.pop("metadata", None)
+    if metadata is not None:
+        # Merge in the database with jsonb || instead of read-modify-write;
+        # the schema's "metadata" field lives in the extra_data column
+        values["extra_data"] = func.coalesce(
+            Taxpayer.extra_data, text("'{}'::jsonb")
+        ).op("||")(cast(metadata, JSONB))
+    values["updated_by"] = current_user.id
+
+    # One UPDATE ... RETURNING instead of entity load + setattr + flush;
+    # updated_at comes from the column's onupdate
+    stmt = (
+        sa_update(Taxpayer)
+        .where(Taxpayer.id == taxpayer_id)
+        .values(**values)
+        .returning(Taxpayer)
+    )
+
+    try:
+        result = await db.execute(stmt)
+        taxpayer = result.scalars().one()
+        await db.commit()
+
+        # Log the update
+        await AuditService.log_action(
+            db=db,
+            user_id=current_user.id,
+            entity_type="taxpayer",
+            entity_id=taxpayer.id,
+            action="update",
+            details={
+                "original": original_data,
+                "updated": update_dict
+            }
         )
-        
-        # Set employer if provided and user has permission
-        if taxpayer_data.employer_id:
-            # Verify employer exists and user has access
-            from api.v1.services.user_service import OrganizationService
-            employer = await OrganizationService.get_by_id(db, taxpayer_data.employer_id)
-            
-            if not employer:
-                raise BadRequestException(f"Organization {taxpayer_data.employer_id} not found")
-            
-            # Check if current user belongs to this organization
-            if current_user.organization_id != taxpayer_data.employer_id and current_user.role.value != "ADMIN":
-                raise ForbiddenException("You can only assign taxpayers to your own organization")
-            
-            db_taxpayer.employer_id = taxpayer_data.employer_id
-        
-        try:
-            db.add(db_taxpayer)
-            await db.commit()
-            await db.refresh(db_taxpayer)
-            
-            # Log the creation
-            await AuditService.log_action(
-                db=db,
-                user_id=current_user.id,
-                entity_type="taxpayer",
-                entity_id=db_taxpayer.id,
-                action="create",
-                details={"data": taxpayer_data.model_dump()}
-            )
-            
-            return db_taxpayer
-        except IntegrityError as e:
-            await db.rollback()
-            if "unique constraint" in str(e).lower():
-                raise ConflictException("Taxpayer with these details already exists")
-            raise BadRequestException(f"Error creating taxpayer: {str(e)}")
+
+        return taxpayer
+    except IntegrityError as e:
+        await db.rollback()
+        raise BadRequestException(f"Error updating taxpayer: {str(e)}")
+
+async def delete(
+    db: AsyncSession,
+    taxpayer_id: uuid.UUID,
+    current_user: User,
+    soft_delete: bool = True
+) -> None:
+    """Delete a taxpayer (soft delete by default)"""
+    taxpayer = await get_by_id(db, taxpayer_id)
+    if not taxpayer:
+        raise NotFoundException(f"Taxpayer {taxpayer_id} not found")
     
-    @staticmethod
-    async def update(
-        db: AsyncSession,
-        taxpayer_id: uuid.UUID,
-        update_data: TaxpayerUpdate,
-        current_user: User
-    ) -> Taxpayer:
-        """Update an existing taxpayer"""
-        taxpayer = await TaxpayerService.get_by_id(db, taxpayer_id)
-        if not taxpayer:
-            raise NotFoundException(f"Taxpayer {taxpayer_id} not found")
-        
-        # Check permissions
-        await TaxpayerService._check_permissions(db, taxpayer, current_user, "update")
-        
-        # Store original data for audit
-        original_data = {
-            "full_name": taxpayer.full_name,
-            "email": taxpayer.email,
-            "status": taxpayer.status.value if taxpayer.status else None,
-            "metadata": taxpayer.metadata.copy() if taxpayer.metadata else {}
-        }
-        
-        # Update fields
-        update_dict = update_data.model_dump(exclude_unset=True)
-        
-        if "metadata" in update_dict and taxpayer.metadata:
-            # Merge metadata instead of replacing
-            taxpayer.metadata.update(update_dict["metadata"])
-            del update_dict["metadata"]
-        
-        for field, value in update_dict.items():
-            setattr(taxpayer, field, value)
-        
-        taxpayer.updated_by = current_user.id
-        taxpayer.updated_at = datetime.utcnow()
-        
-        try:
-            await db.commit()
-            await db.refresh(taxpayer)
-            
-            # Log the update
-            await AuditService.log_action(
-                db=db,
-                user_id=current_user.id,
-                entity_type="taxpayer",
-                entity_id=taxpayer.id,
-                action="update",
-                details={
-                    "original": original_data,
-                    "updated": update_dict
-                }
-            )
-            
-            return taxpayer
-        except IntegrityError as e:
-            await db.rollback()
-            raise BadRequestException(f"Error updating taxpayer: {str(e)}")
+    # Check permissions
+    await _check_permissions(db, taxpayer, current_user, "delete")
     
-    @staticmethod
-    async def delete(
-        db: AsyncSession,
-        taxpayer_id: uuid.UUID,
-        current_user: User,
-        soft_delete: bool = True
-    ) -> None:
-        """Delete a taxpayer (soft delete by default)"""
-        taxpayer = await TaxpayerService.get_by_id(db, taxpayer_id)
-        if not taxpayer:
-            raise NotFoundException(f"Taxpayer {taxpayer_id} not found")
-        
-        # Check permissions
-        await TaxpayerService._check_permissions(db, taxpayer, current_user, "delete")
+    if soft_delete:
+        # Soft delete (update status)
+        taxpayer.status = TaxpayerStatus.DELETED.value
+        taxpayer.updated_by = current_user.id
         
-        if soft_delete:
-            # Soft delete (update status)
-            taxpayer.status = TaxpayerStatus.DELETED
-            taxpayer.updated_by = current_user.id
-            taxpayer.updated_at = datetime.utcnow()
-            
-            await AuditService.log_action(
-                db=db,
-                user_id=current_user.id,
-                entity_type="taxpayer",
-                entity_id=taxpayer.id,
-                action="soft_delete",
-                details={"reason": "User requested deletion"}
-            )
-        else:
-            # Hard delete (remove from database)
-            await db.delete(taxpayer)
-            
-            await AuditService.log_action(
-                db=db,
-                user_id=current_user.id,
-                entity_type="taxpayer",
-                entity_id=taxpayer_id,
-                action="hard_delete",
-                details={"reason": "Permanent deletion requested"}
-            )
+        await AuditService.log_action(
+            db=db,
+            user_id=current_user.id,
+            entity_type="taxpayer",
+            entity_id=taxpayer.id,
+            action="soft_delete",
+            details={"reason": "User requested deletion"}
+        )
+    else:
+        # Hard delete (remove from database)
+        await db.delete(taxpayer)
         
-        await db.commit()
+        await AuditService.log_action(
+            db=db,
+            user_id=current_user.id,
+            entity_type="taxpayer",
+            entity_id=taxpayer_id,
+            action="hard_delete",
+            details={"reason": "Permanent deletion requested"}
+        )
     
-    @staticmethod
-    async def get_all(
-        db: AsyncSession,
-        filter_data: TaxpayerFilter,
-        current_user: User,
-        skip: int = 0,
-        limit: int = 100
-    ) -> tuple[List[Taxpayer], int]:
-        """Get taxpayers with filtering and pagination"""
-        query = select(Taxpayer)
-        
-        # Apply filters
-        query = TaxpayerService._apply_filters(query, filter_data, current_user)
-        
-        # Get total count
+    await db.commit()
+
+async def get_all(
+    db: AsyncSession,
+    filter_data: TaxpayerFilter,
+    current_user: User,
+    skip: int = 0,
+    limit: int = 100
+) -> tuple[list, int]:
+    """Get taxpayer list rows (slim projection) with filtering and pagination"""
+    # Project only the hot columns the list response needs (LIST_COLUMNS).
+    # The window count rides along on the page query so pagination and
+    # total arrive in a single round trip instead of two queries.
+    params: Dict[str, Any] = {}
+
+    if not filter_data.model_dump(exclude_none=True):
+        # Common case: no user filters. Serve a statement prebuilt at
+        # import instead of re-walking every filter branch per request.
+        role = current_user.role
+        if role is not UserRole.ADMIN and role in _ORG_SCOPED_ROLES:
+            query = _NO_FILTER_ORG_QUERY
+            params["org_id"] = current_user.organization_id
+        else:
+            query = _NO_FILTER_QUERY
+    else:
+        query = select(*LIST_COLUMNS, func.count().over().label("total"))
+        query = _apply_filters(query, filter_data, current_user)
+
+    result = await db.execute(query.offset(skip).limit(limit), params)
+    taxpayers = result.all()
+
+    if taxpayers:
+        total = taxpayers[0].total
+    elif skip == 0:
+        total = 0
+    else:
+        # Paged past the end: no rows carry the window count, so fall
+        # back to one plain count for an accurate total
         count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
-        
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-        
-        # Execute query
-        result = await db.execute(query)
-        taxpayers = result.scalars().all()
-        
-        return taxpayers, total
+        total = (await db.execute(count_query, params)).scalar()
+
+    return taxpayers, total
+
+async def stream_all(
+    db: AsyncSession,
+    filter_data: TaxpayerFilter,
+    current_user: User,
+    chunk_size: int = 500,
+):
+    """Stream slim taxpayer rows for exports.
+
+    A server-side cursor with yield_per keeps memory O(chunk) regardless
+    of result size and delivers the first rows immediately instead of
+    after the full materialization; there is deliberately no count query
+    on this path.
+    """
+    query = _apply_filters(select(*LIST_COLUMNS), filter_data, current_user)
+    result = await db.stream(query.execution_options(yield_per=chunk_size))
+    async for partition in result.partitions(chunk_size):
+        for row in partition:
+            yield row
+
+def _apply_filters(query, filter_data: TaxpayerFilter, current_user: User):
+    """Apply filters to query based on user permissions"""
+    # Hoist the enum-descriptor chain to a local; it is consulted for
+    # every filter decision below
+    role = current_user.role
+
+    # Base permission filter
+    if role is not UserRole.ADMIN and role in _ORG_SCOPED_ROLES:
+        # Non-admin users can only see their organization's taxpayers
+        query = query.where(Taxpayer.employer_id == current_user.organization_id)
     
-    @staticmethod
-    def _apply_filters(query, filter_data: TaxpayerFilter, current_user: User):
-        """Apply filters to query based on user permissions"""
-        
-        # Base permission filter
-        if current_user.role.value != "ADMIN":
-            # Non-admin users can only see their organization's taxpayers
-            if current_user.role.value in ["ACCOUNTANT", "EMPLOYER"]:
-                query = query.where(Taxpayer.employer_id == current_user.organization_id)
-        
-        # Apply user-provided filters
-        if filter_data.state:
-            query = query.where(Taxpayer.state == filter_data.state)
-        
-        if filter_data.tax_type:
-            query = query.where(Taxpayer.tax_type == filter_data.tax_type)
-        
-        if filter_data.status:
-            query = query.where(Taxpayer.status == filter_data.status)
-        else:
-            # Exclude deleted taxpayers by default
-            query = query.where(Taxpayer.status != TaxpayerStatus.DELETED)
-        
-        if filter_data.employer_id:
-            query = query.where(Taxpayer.employer_id == filter_data.employer_id)
-        
-        if filter_data.is_verified is not None:
-            query = query.where(Taxpayer.is_verified == filter_data.is_verified)
-        
-        if filter_data.search:
-            search_pattern = f"%{filter_data.search}%"
-            query = query.where(
-                or_(
-                    Taxpayer.full_name.ilike(search_pattern),
-                    Taxpayer.tin.ilike(search_pattern),
-                    Taxpayer.business_name.ilike(search_pattern),
-                    Taxpayer.email.ilike(search_pattern)
-                )
+    # Apply user-provided filters
+    if filter_data.state:
+        query = query.where(Taxpayer.state == filter_data.state)
+    
+    if filter_data.tax_type:
+        query = query.where(Taxpayer.tax_type == filter_data.tax_type)
+    
+    if filter_data.status:
+        query = query.where(Taxpayer.status == filter_data.status)
+    else:
+        # Exclude deleted taxpayers by default
+        query = query.where(Taxpayer.status != TaxpayerStatus.DELETED)
+    
+    if filter_data.employer_id:
+        query = query.where(Taxpayer.employer_id == filter_data.employer_id)
+    
+    if filter_data.is_verified is not None:
+        query = query.where(Taxpayer.is_verified == filter_data.is_verified)
+    
+    if filter_data.search:
+        # One ILIKE over the indexed concatenation instead of an OR of
+        # four per-column ILIKEs none of which could use an index
+        query = query.where(_SEARCH_DOC.ilike(f"%{filter_data.search}%"))
+    
+    if filter_data.created_after:
+        query = query.where(Taxpayer.created_at >= filter_data.created_after)
+    
+    if filter_data.created_before:
+        query = query.where(Taxpayer.created_at <= filter_data.created_before)
+    
+    # Order by creation date (newest first)
+    query = query.order_by(Taxpayer.created_at.desc())
+    
+    return query
+
+async def _check_permissions(
+    db: AsyncSession,
+    taxpayer: Taxpayer,
+    current_user: User,
+    action: str
+) -> None:
+    """Check if user has permission to perform action on taxpayer"""
+    role = current_user.role
+
+    # Admins can do anything
+    if role is UserRole.ADMIN:
+        return
+
+    # Accountants and Employers can only manage their organization's taxpayers
+    if role in _ORG_SCOPED_ROLES:
+        if taxpayer.employer_id != current_user.organization_id:
+            raise ForbiddenException(
+                f"You don't have permission to {action} this taxpayer"
             )
-        
-        if filter_data.created_after:
-            query = query.where(Taxpayer.created_at >= filter_data.created_after)
-        
-        if filter_data.created_before:
-            query = query.where(Taxpayer.created_at <= filter_data.created_before)
-        
-        # Order by creation date (newest first)
-        query = query.order_by(Taxpayer.created_at.desc())
-        
-        return query
+
+    # Organization users have limited access
+    if role is UserRole.ORGANIZATION:
+        raise ForbiddenException(
+            f"Organization users cannot {action} taxpayers"
+        )
+
+async def verify_taxpayer(
+    db: AsyncSession,
+    taxpayer_id: uuid.UUID,
+    current_user: User,
+    verification_data: Optional[Dict[str, Any]] = None
+) -> Taxpayer:
+    """Mark taxpayer as verified"""
+    taxpayer = await get_by_id(db, taxpayer_id)
+    if not taxpayer:
+        raise NotFoundException(f"Taxpayer {taxpayer_id} not found")
     
-    @staticmethod
-    async def _check_permissions(
-        db: AsyncSession,
-        taxpayer: Taxpayer,
-        current_user: User,
-        action: str
-    ) -> None:
-        """Check if user has permission to perform action on taxpayer"""
-        
-        # Admins can do anything
-        if current_user.role.value == "ADMIN":
-            return
-        
-        # Accountants and Employers can only manage their organization's taxpayers
-        if current_user.role.value in ["ACCOUNTANT", "EMPLOYER"]:
-            if taxpayer.employer_id != current_user.organization_id:
-                raise ForbiddenException(
-                    f"You don't have permission to {action} this taxpayer"
-                )
-        
-        # Organization users have limited access
-        if current_user.role.value == "ORGANIZATION":
+    role = current_user.role
+
+    # Check permissions (only admins and organization accountants can verify)
+    if role not in (UserRole.ADMIN, UserRole.ACCOUNTANT):
+        raise ForbiddenException("You don't have permission to verify taxpayers")
+
+    if taxpayer.employer_id and role is UserRole.ACCOUNTANT:
+        if taxpayer.employer_id != current_user.organization_id:
             raise ForbiddenException(
-                f"Organization users cannot {action} taxpayers"
+                "You can only verify taxpayers in your organization"
             )
     
-    @staticmethod
-    async def verify_taxpayer(
-        db: AsyncSession,
-        taxpayer_id: uuid.UUID,
-        current_user: User,
-        verification_data: Optional[Dict[str, Any]] = None
-    ) -> Taxpayer:
-        """Mark taxpayer as verified"""
-        taxpayer = await TaxpayerService.get_by_id(db, taxpayer_id)
-        if not taxpayer:
-            raise NotFoundException(f"Taxpayer {taxpayer_id} not found")
-        
-        # Check permissions (only admins and organization accountants can verify)
-        if current_user.role.value not in ["ADMIN", "ACCOUNTANT"]:
-            raise ForbiddenException("You don't have permission to verify taxpayers")
-        
-        if taxpayer.employer_id and current_user.role.value == "ACCOUNTANT":
-            if taxpayer.employer_id != current_user.organization_id:
-                raise ForbiddenException(
-                    "You can only verify taxpayers in your organization"
-                )
-        
-        taxpayer.is_verified = True
-        taxpayer.verification_date = date.today()
-        taxpayer.updated_by = current_user.id
-        taxpayer.updated_at = datetime.utcnow()
-        
-        if verification_data:
-            if not taxpayer.metadata:
-                taxpayer.metadata = {}
-            taxpayer.metadata["verification"] = verification_data
-        
-        await db.commit()
-        await db.refresh(taxpayer)
-        
+    taxpayer.is_verified = True
+    taxpayer.verification_date = date.today()
+    taxpayer.updated_by = current_user.id
+    
+    if verification_data:
+        # Reassign rather than mutate in place: plain JSONB columns have
+        # no mutation tracking, and the schema's metadata maps to
+        # the extra_data column
+        merged = dict(taxpayer.extra_data or {})
+        merged["verification"] = verification_data
+        taxpayer.extra_data = merged
+    
+    await db.commit()
+    await db.refresh(taxpayer)
+    
+    await AuditService.log_action(
+        db=db,
+        user_id=current_user.id,
+        entity_type="taxpayer",
+        entity_id=taxpayer.id,
+        action="verify",
+        details=verification_data or {}
+    )
+    
+    return taxpayer
+
+async def bulk_create(
+    db: AsyncSession,
+    taxpayers_data: List[TaxpayerCreate],
+    current_user: User
+) -> tuple[List[Taxpayer], List[Dict[str, Any]]]:
+    """Create multiple taxpayers at once via bin-packed multi-VALUES inserts"""
+    successful: List[Taxpayer] = []
+    failed: List[Dict[str, Any]] = []
+
+    # Build insert rows up front; permission failures and intra-batch
+    # duplicates never hit the DB. Role and org are hoisted out of the
+    # per-row loop.
+    is_admin = current_user.role is UserRole.ADMIN
+    own_org_id = current_user.organization_id
+    rows: List[Dict[str, Any]] = []
+    seen_tins: set = set()
+    for data in taxpayers_data:
+        # Dump each model exactly once; every branch below reuses it
+        row = data.model_dump()
+
+        if (
+            data.employer_id
+            and data.employer_id != own_org_id
+            and not is_admin
+        ):
+            failed.append({
+                "data": row,
+                "error": "You can only assign taxpayers to your own organization"
+            })
+            continue
+
+        # TIN-less rows never conflict (the unique index permits any
+        # number of NULLs), so only real TINs take part in the dedupe
+        if row["tin"] is not None:
+            if row["tin"] in seen_tins:
+                # Without this, the second occurrence is silently dropped by
+                # ON CONFLICT and then misread as inserted when TINs are diffed
+                failed.append({
+                    "data": row,
+                    "error": f"Duplicate TIN {row['tin']} within this batch"
+                })
+                continue
+            seen_tins.add(row["tin"])
+
+        row["extra_data"] = row.pop("metadata", None) or {}
+        row["created_by"] = current_user.id
+        row["updated_by"] = current_user.id
+        rows.append(row)
+
+    # Pre-validate employer ids with one IN-list SELECT (mirroring the TIN
+    # pre-dedupe): a nonexistent employer_id would otherwise surface as an
+    # unhandled FK violation that aborts the whole batch, where the per-row
+    # path recorded that row as failed and carried on
+    employer_ids = {row["employer_id"] for row in rows if row["employer_id"]}
+    if employer_ids:
+        result = await db.execute(
+            select(Organization.id).where(Organization.id.in_(employer_ids))
+        )
+        missing_orgs = employer_ids - set(result.scalars().all())
+        if missing_orgs:
+            remaining = []
+            for row in rows:
+                if row["employer_id"] in missing_orgs:
+                    failed.append({
+                        "data": {k: v for k, v in row.items()
+                                 if k not in ("created_by", "updated_by")},
+                        "error": f"Organization {row['employer_id']} not found"
+                    })
+                else:
+                    remaining.append(row)
+            rows = remaining
+
+    # One INSERT per batch instead of one round-trip per row; duplicate
+    # TINs are skipped by the unique index rather than per-row try/except
+    audit_payloads: List[tuple] = []
+    for start in range(0, len(rows), _BULK_BATCH_SIZE):
+        chunk = rows[start:start + _BULK_BATCH_SIZE]
+        stmt = (
+            pg_insert(Taxpayer)
+            .values(chunk)
+            .on_conflict_do_nothing(index_elements=["tin"])
+            .returning(Taxpayer)
+        )
+        result = await db.execute(stmt)
+        inserted = result.scalars().all()
+        successful.extend(inserted)
+
+        # One cleaned copy per row (input minus the stamping columns)
+        # serves both the duplicate classification and the audit payload
+        inserted_tins = {tp.tin for tp in inserted if tp.tin}
+        payload_by_tin: Dict[str, Dict[str, Any]] = {}
+        tinless_payloads: List[Dict[str, Any]] = []
+        for row in chunk:
+            cleaned = {k: v for k, v in row.items()
+                       if k not in ("created_by", "updated_by")}
+            if row["tin"] is None:
+                # NULL TINs never conflict, so these always inserted
+                tinless_payloads.append(cleaned)
+            elif row["tin"] in inserted_tins:
+                payload_by_tin[row["tin"]] = cleaned
+            else:
+                failed.append({
+                    "data": cleaned,
+                    "error": f"Taxpayer with TIN {row['tin']} already exists"
+                })
+
+        tinless_iter = iter(tinless_payloads)
+        for taxpayer in inserted:
+            if taxpayer.tin:
+                payload = payload_by_tin.get(taxpayer.tin, {})
+            else:
+                payload = next(tinless_iter, {})
+            audit_payloads.append((taxpayer, payload))
+
+    for taxpayer, payload in audit_payloads:
         await AuditService.log_action(
             db=db,
             user_id=current_user.id,
             entity_type="taxpayer",
             entity_id=taxpayer.id,
-            action="verify",
-            details=verification_data or {}
+            action="bulk_create",
+            details={"data": payload}
         )
-        
-        return taxpayer
-    
-    @staticmethod
-    async def bulk_create(
-        db: AsyncSession,
-        taxpayers_data: List[TaxpayerCreate],
-        current_user: User
-    ) -> tuple[List[Taxpayer], List[Dict[str, Any]]]:
-        """Create multiple taxpayers at once"""
-        successful = []
-        failed = []
-        
-        for data in taxpayers_data:
-            try:
-                taxpayer = await TaxpayerService.create(db, data, current_user)
-                successful.append(taxpayer)
-                
-                await AuditService.log_action(
-                    db=db,
-                    user_id=current_user.id,
-                    entity_type="taxpayer",
-                    entity_id=taxpayer.id,
-                    action="bulk_create",
-                    details={"data": data.model_dump()}
-                )
-                
-            except Exception as e:
-                failed.append({
-                    "data": data.model_dump(),
-                    "error": str(e)
-                })
-        
-        # Commit once after all operations
-        await db.commit()
-        
-        return successful, failed
-    
-    @staticmethod
-    async def get_stats(
-        db: AsyncSession,
-        current_user: User,
-        organization_id: Optional[uuid.UUID] = None
-    ) -> Dict[str, Any]:
-        """Get taxpayer statistics"""
-        
-        # Base query with permission filter
-        query = select(Taxpayer)
-        
-        if current_user.role.value != "ADMIN":
-            if current_user.role.value in ["ACCOUNTANT", "EMPLOYER"]:
-                query = query.where(Taxpayer.employer_id == current_user.organization_id)
-            elif current_user.role.value == "ORGANIZATION":
-                # Organizations can only see aggregate stats
-                pass
-        
-        if organization_id:
-            query = query.where(Taxpayer.employer_id == organization_id)
-        
-        # Exclude deleted taxpayers
-        query = query.where(Taxpayer.status != TaxpayerStatus.DELETED)
-        
-        # Get counts by tax type
-        tax_type_query = select(
+
+    # Commit once after all operations
+    await db.commit()
+
+    return successful, failed
+
+async def get_stats(
+    db: AsyncSession,
+    current_user: User,
+    organization_id: Optional[uuid.UUID] = None
+) -> Dict[str, Any]:
+    """Get taxpayer statistics"""
+
+    # Permission filter shared by every aggregate
+    conditions = [Taxpayer.status != TaxpayerStatus.DELETED]
+    role = current_user.role
+
+    if role is not UserRole.ADMIN:
+        if role in _ORG_SCOPED_ROLES:
+            conditions.append(Taxpayer.employer_id == current_user.organization_id)
+        elif role is UserRole.ORGANIZATION:
+            # Organizations can only see aggregate stats
+            pass
+
+    if organization_id:
+        conditions.append(Taxpayer.employer_id == organization_id)
+
+    # One GROUPING SETS scan replaces four subquery round trips (total,
+    # verified, by tax_type, by status); GROUPING() tags which set each
+    # output row belongs to so NULL group keys stay unambiguous
+    stats_query = (
+        select(
             Taxpayer.tax_type,
-            func.count(Taxpayer.id)
-        ).select_from(query.subquery()).group_by(Taxpayer.tax_type)
-        
-        tax_type_result = await db.execute(tax_type_query)
-        tax_type_counts = dict(tax_type_result.all())
-        
-        # Get counts by status
-        status_query = select(
             Taxpayer.status,
-            func.count(Taxpayer.id)
-        ).select_from(query.subquery()).group_by(Taxpayer.status)
-        
-        status_result = await db.execute(status_query)
-        status_counts = dict(status_result.all())
-        
-        # Get total count
-        total_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(total_query)
-        total = total_result.scalar()
-        
-        # Get verified count
-        verified_query = select(func.count()).where(
-            query.whereclause & (Taxpayer.is_verified == True)
+            func.count().label("c"),
+            func.count().filter(Taxpayer.is_verified.is_(True)).label("v"),
+            func.grouping(Taxpayer.tax_type, Taxpayer.status).label("g"),
         )
-        verified_result = await db.execute(verified_query)
-        verified_count = verified_result.scalar()
-        
-        return {
-            "total": total,
-            "verified": verified_count,
-            "verification_rate": (verified_count / total * 100) if total > 0 else 0,
-            "by_tax_type": tax_type_counts,
-            "by_status": status_counts,
-            "by_state": {},  # Can be implemented similarly
-        }
\ No newline at end of file
+        .where(*conditions)
+        .group_by(text("GROUPING SETS ((), (tax_type), (status))"))
+    )
+
+    tax_type_counts: Dict[str, int] = {}
+    status_counts: Dict[str, int] = {}
+    total = 0
+    verified_count = 0
+
+    for row in await db.execute(stats_query):
+        if row.g == 3:  # grand total set ()
+            total = row.c
+            verified_count = row.v
+        elif row.g == 1:  # grouped by tax_type
+            tax_type_counts[row.tax_type] = row.c
+        else:  # g == 2, grouped by status
+            status_counts[row.status] = row.c
+
+    return {
+        "total": total,
+        "verified": verified_count,
+        "verification_rate": (verified_count / total * 100) if total > 0 else 0,
+        "by_tax_type": tax_type_counts,
+        "by_status": status_counts,
+        "by_state": {},  # Can be implemented similarly
+    }
+
+class TaxpayerService:
+    """Namespace retained for existing call sites and tests.
+
+    The implementations live as module-level functions so intra-module
+    calls are plain LOAD_GLOBALs instead of descriptor lookups; the class
+    attributes simply alias them.
+    """
+    get_by_id = staticmethod(get_by_id)
+    get_related_counts = staticmethod(get_related_counts)
+    get_by_tin = staticmethod(get_by_tin)
+    create = staticmethod(create)
+    update = staticmethod(update)
+    delete = staticmethod(delete)
+    get_all = staticmethod(get_all)
+    stream_all = staticmethod(stream_all)
+    _apply_filters = staticmethod(_apply_filters)
+    _check_permissions = staticmethod(_check_permissions)
+    verify_taxpayer = staticmethod(verify_taxpayer)
+    bulk_create = staticmethod(bulk_create)
+    get_stats = staticmethod(get_stats)
@@ -1,12 +1,15 @@
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import bindparam, select, update, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 import uuid
 
 from api.v1.models.user import User, Organization, UserRole
 from api.v1.schemas.user import UserCreate, OrganizationCreate, UserUpdate, PasswordChange
-from core.security import get_password_hash, verify_password
+from core import auth_cache
+from api.v1.services.auth_service import invalidate_user_cache
+from core.security import DUMMY_HASH, hash_password_async, verify_password_async
 from api.utils.exceptions import (
     NotFoundException,
     BadRequestException,
@@ -14,41 +17,101 @@ from api.utils.exceptions import (
     UnauthorizedException,
 )
 
+# Hot single-row lookups, built once at import. Execution still hits the
+# compiled-SQL cache; this also skips re-walking select()/where() per call.
+_SELECT_USER_BY_ID = select(User).where(User.id == bindparam("uid"))
+_SELECT_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_SELECT_ORG_BY_ID = select(Organization).where(Organization.id == bindparam("oid"))
+
+def _ensure_can_modify(current_user: User, target_id: uuid.UUID, action: str) -> None:
+    """Self-or-admin check shared by update/change_password/delete.
+
+    Decidable from ids and the already-loaded role alone — no read of the
+    target row — which is what lets the callers go straight to
+    UPDATE ... RETURNING without a pre-SELECT.
+    """
+    # Identity compare: SQLAlchemy's Enum type always hands back the member
+    # singleton, so `is` skips the str-subclass equality path entirely
+    if target_id != current_user.id and current_user.role is not UserRole.ADMIN:
+        raise UnauthorizedException(f"Not authorized to {action} this user")
+
+# Insert columns precomputed at import: everything on UserCreate except
+# the plaintext password, which becomes password_hash
+_USER_INSERT_FIELDS = tuple(f for f in UserCreate.model_fields if f != "password")
+
+def _fields_set_dict(data) -> dict:
+    """Build an update dict from the fields the client actually sent.
+
+    Reads __pydantic_fields_set__ directly instead of
+    model_dump(exclude_unset=True), which walks the full schema and
+    copies every field just to drop the unset ones.
+    """
+    return {f: getattr(data, f) for f in data.__pydantic_fields_set__}
+
+# Postgres default names for the unique constraints on organizations
+# (<table>_<column>_key); maps a violated constraint to its client message
+_ORG_CONSTRAINT_MESSAGES = {
+    "organizations_registration_number_key": "Registration number already in use",
+    "organizations_tax_identification_number_key": "Tax identification number already in use",
+}
+
 class UserService:
     @staticmethod
     async def get_by_id(db: AsyncSession, user_id: uuid.UUID) -> Optional[User]:
-        result = await db.execute(select(User).where(User.id == user_id))
-        return result.scalar_one_or_none()
+        # Short-TTL cache: user rows barely change but are read on nearly
+        # every request, so hits skip the SELECT (and the pool checkout)
+        user = auth_cache.get("id", user_id)
+        if user is not None:
+            return user
+        result = await db.execute(_SELECT_USER_BY_ID, {"uid": user_id})
+        user = result.scalar_one_or_none()
+        if user is not None:
+            auth_cache.put("id", user.id, user)
+            auth_cache.put("email", user.email, user)
+        return user
 
     @staticmethod
     async def get_by_email(db: AsyncSession, email: str) -> Optional[User]:
-        result = await db.execute(select(User).where(User.email == email))
-        return result.scalar_one_or_none()
+        user = auth_cache.get("email", email)
+        if user is not None:
+            return user
+        result = await db.execute(_SELECT_USER_BY_EMAIL, {"email": email})
+        user = result.scalar_one_or_none()
+        if user is not None:
+            auth_cache.put("id", user.id, user)
+            auth_cache.put("email", user.email, user)
+        return user
 
     @staticmethod
     async def create(db: AsyncSession, user_data: UserCreate) -> User:
-        # Check if user already exists
-        existing_user = await UserService.get_by_email(db, user_data.email)
-        if existing_user:
-            raise ConflictException("User with this email already exists")
+        # Hash password off the event loop; the loop keeps serving other
+        # requests for the duration of the Argon2 work
+        hashed_password = await hash_password_async(user_data.password)
 
-        # Hash password
-        hashed_password = get_password_hash(user_data.password)
-        
-        # Create user
-        db_user = User(
-            **user_data.model_dump(exclude={"password"}),
-            password_hash=hashed_password
-        )
-        
+        # The unique index on email is the existence check: ON CONFLICT
+        # DO NOTHING returns no row for a duplicate, replacing the
+        # pre-flight SELECT (which could race anyway) and the refresh
+        row = {f: getattr(user_data, f) for f in _USER_INSERT_FIELDS}
+        row["password_hash"] = hashed_password
         try:
-            db.add(db_user)
-            await db.commit()
-            await db.refresh(db_user)
-            return db_user
+            result = await db.execute(
+                pg_insert(User)
+                .values(**row)
+                .on_conflict_do_nothing(index_elements=["email"])
+                .returning(User)
+            )
         except IntegrityError:
+            # ON CONFLICT only absorbs the email index; a client-supplied
+            # organization_id that fails the FK still lands here and must
+            # stay a 409, not an unhandled 500
             await db.rollback()
             raise ConflictException("User could not be created")
+        db_user = result.scalars().one_or_none()
+        if db_user is None:
+            await db.rollback()
+            raise ConflictException("User with this email already exists")
+        await db.commit()
+        return db_user
 
     @staticmethod
     async def update(
@@ -57,32 +120,43 @@ class UserService:
         update_data: UserUpdate,
         current_user: User
     ) -> User:
-        # Check if user exists
-        user = await UserService.get_by_id(db, user_id)
-        if not user:
-            raise NotFoundException("User not found")
-        
-        # Check permissions (users can only update themselves unless admin)
-        if user.id != current_user.id and current_user.role != UserRole.ADMIN:
-            raise UnauthorizedException("Not authorized to update this user")
-        
+        _ensure_can_modify(current_user, user_id, "update")
+
         # Check if new email is already taken
-        if update_data.email and update_data.email != user.email:
+        if update_data.email:
             existing = await UserService.get_by_email(db, update_data.email)
             if existing and existing.id != user_id:
                 raise ConflictException("Email already in use")
-        
-        # Update user
-        update_dict = update_data.model_dump(exclude_unset=True)
-        if update_dict:
-            await db.execute(
-                update(User)
-                .where(User.id == user_id)
-                .values(**update_dict)
-            )
-            await db.commit()
-            await db.refresh(user)
-        
+
+        update_dict = _fields_set_dict(update_data)
+        if not update_dict:
+            user = await UserService.get_by_id(db, user_id)
+            if not user:
+                raise NotFoundException("User not found")
+            return user
+
+        # Capture the old email for cache invalidation before it changes
+        cached = auth_cache.get("id", user_id)
+        old_email = cached.email if cached is not None else None
+
+        # One UPDATE ... RETURNING replaces SELECT + UPDATE + refresh
+        result = await db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(**update_dict)
+            .returning(User)
+        )
+        user = result.scalars().one_or_none()
+        if user is None:
+            await db.rollback()
+            raise NotFoundException("User not found")
+        await db.commit()
+        # Both user caches: the service-layer one and the per-request one
+        # consulted by AuthService.get_current_user — a stale entry in the
+        # latter would keep serving the pre-update row to authentication
+        auth_cache.invalidate(user_id, old_email, update_data.email, user.email)
+        invalidate_user_cache(user_id)
+
         return user
 
     @staticmethod
@@ -92,63 +166,96 @@ class UserService:
         password_data: PasswordChange,
         current_user: User
     ) -> None:
-        # Check if user exists
-        user = await UserService.get_by_id(db, user_id)
-        if not user:
-            raise NotFoundException("User not found")
-        
-        # Check permissions (users can only change their own password unless admin)
-        if user.id != current_user.id and current_user.role != UserRole.ADMIN:
-            raise UnauthorizedException("Not authorized to change this user's password")
-        
-        # Verify current password
-        if not verify_password(password_data.current_password, user.password_hash):
+        _ensure_can_modify(current_user, user_id, "change the password of")
+
+        # Slim pre-read: only the hash (to verify) and email (to invalidate)
+        row = (await db.execute(
+            select(User.password_hash, User.email).where(User.id == user_id)
+        )).first()
+
+        # Branchless accumulation with a single raise: a missing row
+        # verifies against DUMMY_HASH, so both failure modes pay the same
+        # Argon2 cost and surface the same error (off-loop verify)
+        password_hash = row.password_hash if row is not None else DUMMY_HASH
+        ok = row is not None
+        ok &= await verify_password_async(password_data.current_password, password_hash)
+        if not ok:
             raise BadRequestException("Current password is incorrect")
-        
+
         # Update password
-        new_hashed_password = get_password_hash(password_data.new_password)
+        new_hashed_password = await hash_password_async(password_data.new_password)
         await db.execute(
             update(User)
             .where(User.id == user_id)
             .values(password_hash=new_hashed_password)
         )
         await db.commit()
+        auth_cache.invalidate(user_id, row.email)
+        invalidate_user_cache(user_id)
 
     @staticmethod
     async def delete(db: AsyncSession, user_id: uuid.UUID, current_user: User) -> None:
+        _ensure_can_modify(current_user, user_id, "delete")
+
         # Check if user exists
         user = await UserService.get_by_id(db, user_id)
         if not user:
             raise NotFoundException("User not found")
-        
-        # Check permissions (users can only delete themselves unless admin)
-        if user.id != current_user.id and current_user.role != UserRole.ADMIN:
-            raise UnauthorizedException("Not authorized to delete this user")
-        
+
         # Don't allow self-deletion if admin (or implement soft delete)
         await db.execute(delete(User).where(User.id == user_id))
         await db.commit()
+        # Without this a deleted user could keep authenticating from the
+        # auth cache until its TTL lapsed
+        auth_cache.invalidate(user_id, user.email)
+        invalidate_user_cache(user_id)
 
     @staticmethod
     async def get_all(
-        db: AsyncSession, 
-        skip: int = 0, 
+        db: AsyncSession,
+        skip: int = 0,
         limit: int = 100,
-        organization_id: Optional[uuid.UUID] = None
+        organization_id: Optional[uuid.UUID] = None,
+        cursor_id: Optional[uuid.UUID] = None
     ) -> List[User]:
         query = select(User)
-        
+
         if organization_id:
             query = query.where(User.organization_id == organization_id)
-        
-        query = query.offset(skip).limit(limit)
+
+        if cursor_id is not None:
+            # Keyset pagination: O(limit) at any depth, walks
+            # ix_users_org_id instead of skipping `skip` rows like OFFSET
+            query = query.where(User.id > cursor_id).order_by(User.id)
+        else:
+            query = query.order_by(User.id).offset(skip)
+        query = query.limit(limit)
         result = await db.execute(query)
         return result.scalars().all()
 
+    @staticmethod
+    async def stream_all(
+        db: AsyncSession,
+        organization_id: Optional[uuid.UUID] = None,
+        chunk_size: int = 100,
+    ) -> AsyncIterator[User]:
+        """Stream users through a server-side cursor for export-sized reads.
+
+        get_all stays list-returning for the paged dashboard case; this
+        variant keeps memory O(chunk) when no page bound applies.
+        """
+        query = select(User)
+        if organization_id:
+            query = query.where(User.organization_id == organization_id)
+
+        result = await db.stream(query.execution_options(yield_per=chunk_size))
+        async for user in result.scalars():
+            yield user
+
 class OrganizationService:
     @staticmethod
     async def get_by_id(db: AsyncSession, org_id: uuid.UUID) -> Optional[Organization]:
-        result = await db.execute(select(Organization).where(Organization.id == org_id))
+        result = await db.execute(_SELECT_ORG_BY_ID, {"oid": org_id})
         return result.scalar_one_or_none()
 
     @staticmethod
@@ -162,12 +269,17 @@ class OrganizationService:
             return db_org
         except IntegrityError as e:
             await db.rollback()
-            # Check which constraint was violated
-            if "registration_number" in str(e):
-                raise ConflictException("Registration number already in use")
-            elif "tax_identification_number" in str(e):
-                raise ConflictException("Tax identification number already in use")
-            raise ConflictException("Organization could not be created")
+            # asyncpg names the violated constraint directly; dispatching on
+            # it avoids rendering str(e) (full SQL + params) just to
+            # substring-scan it. SQLAlchemy chains the asyncpg error under
+            # e.orig.__cause__.
+            orig = getattr(e.orig, "__cause__", None) or e.orig
+            constraint = getattr(orig, "constraint_name", None)
+            raise ConflictException(
+                _ORG_CONSTRAINT_MESSAGES.get(
+                    constraint, "Organization could not be created"
+                )
+            )
 
     @staticmethod
     async def update(
@@ -175,20 +287,27 @@ class OrganizationService:
         org_id: uuid.UUID,
         update_data: OrganizationCreate
     ) -> Organization:
-        org = await OrganizationService.get_by_id(db, org_id)
-        if not org:
+        update_dict = _fields_set_dict(update_data)
+        if not update_dict:
+            org = await OrganizationService.get_by_id(db, org_id)
+            if not org:
+                raise NotFoundException("Organization not found")
+            return org
+
+        # One UPDATE ... RETURNING replaces SELECT + UPDATE + refresh;
+        # a missing id simply returns no row
+        result = await db.execute(
+            update(Organization)
+            .where(Organization.id == org_id)
+            .values(**update_dict)
+            .returning(Organization)
+        )
+        org = result.scalars().one_or_none()
+        if org is None:
+            await db.rollback()
             raise NotFoundException("Organization not found")
-        
-        update_dict = update_data.model_dump(exclude_unset=True)
-        if update_dict:
-            await db.execute(
-                update(Organization)
-                .where(Organization.id == org_id)
-                .values(**update_dict)
-            )
-            await db.commit()
-            await db.refresh(org)
-        
+        await db.commit()
+
         return org
 
     @staticmethod
@@ -202,7 +321,23 @@ class OrganizationService:
         
         if org_type:
             query = query.where(Organization.type == org_type)
-        
+
         query = query.offset(skip).limit(limit)
         result = await db.execute(query)
-        return result.scalars().all()
\ No newline at end of file
+        return result.scalars().all()
+
+    @staticmethod
+    async def stream_all(
+        db: AsyncSession,
+        org_type: Optional[str] = None,
+        chunk_size: int = 100,
+    ) -> AsyncIterator[Organization]:
+        """Stream organizations through a server-side cursor (see
+        UserService.stream_all)."""
+        query = select(Organization)
+        if org_type:
+            query = query.where(Organization.type == org_type)
+
+        result = await db.stream(query.execution_options(yield_per=chunk_size))
+        async for org in result.scalars():
+            yield org
\ No newline at end of file
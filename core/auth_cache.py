@@ -0,0 +1,43 @@
+"""In-process TTL cache for user lookups on the auth path.
+
+User rows change rarely but are read on nearly every authenticated
+request, so a short TTL turns the repeat SELECTs into dict hits. Entries
+are dual-keyed by id and email and must be invalidated together on any
+mutation (see invalidate). Everything runs on the event loop thread, so
+plain dict operations need no locking. A Redis L2 would slot in below
+the miss path if this service ever runs more than one process per cache
+domain; it is not a dependency today.
+"""
+from time import monotonic
+from typing import Dict, Optional, Tuple
+
+TTL_SECONDS = 60.0
+_MAX_ENTRIES = 10_000
+
+# (kind, key) -> (user, expiry); kind is "id" or "email"
+_cache: Dict[Tuple[str, str], Tuple[object, float]] = {}
+
+def get(kind: str, key) -> Optional[object]:
+    """Return the cached user for ("id", uuid) / ("email", str), or None."""
+    entry = _cache.get((kind, str(key)))
+    if entry is None:
+        return None
+    user, expires = entry
+    if monotonic() >= expires:
+        _cache.pop((kind, str(key)), None)
+        return None
+    return user
+
+def put(kind: str, key, user) -> None:
+    if len(_cache) >= _MAX_ENTRIES:
+        # Bounded like the other auth caches: evict the oldest insertion
+        del _cache[next(iter(_cache))]
+    _cache[(kind, str(key))] = (user, monotonic() + TTL_SECONDS)
+
+def invalidate(user_id=None, *emails: Optional[str]) -> None:
+    """Drop a user's entries; pass every email the row may be cached under."""
+    if user_id is not None:
+        _cache.pop(("id", str(user_id)), None)
+    for email in emails:
+        if email:
+            _cache.pop(("email", email), None)
@@ -1,4 +1,6 @@
-from datetime import datetime, timedelta
+import asyncio
+from datetime import datetime, timedelta, timezone
+from time import time
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -6,11 +8,31 @@ from fastapi import HTTPException, status
 
 from core.config import settings
 
+# Argon2id sized to the OWASP baseline (19 MiB, t=2, p=1): ~50ms per
+# hash on current hardware instead of passlib's heavier defaults, which
+# directly bounds login latency and concurrent-login throughput
 pwd_context = CryptContext(
     schemes=["argon2"],
     deprecated="auto",
+    argon2__memory_cost=19456,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
 )
 
+# Verified against when a login email has no account, so the missing-user
+# branch costs the same Argon2 work as a real verify and response timing
+# stops leaking which emails are registered. Hashed once at import.
+DUMMY_HASH = pwd_context.hash("incorrect-password-placeholder")
+
+# Encode the HMAC key once at import instead of per decode call
+_SECRET_KEY_BYTES = settings.SECRET_KEY.encode("utf-8")
+
+# Verified-token cache: token -> (payload, exp timestamp). Signature
+# verification is CPU-bound and runs on every authenticated request, so
+# repeat requests with the same token skip it until the token expires.
+_DECODE_CACHE_MAX = 10_000
+_decode_cache: dict = {}
+
 # Password utilities
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
@@ -18,26 +40,53 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+# Async wrappers: Argon2 burns ~50ms of CPU on purpose, which would
+# otherwise stall the event loop and serialize every in-flight request.
+# argon2-cffi releases the GIL during hashing, so a worker thread gives
+# real parallelism without the pickling cost of a process pool.
+async def hash_password_async(password: str) -> str:
+    return await asyncio.to_thread(get_password_hash, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
 # JWT utilities
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 def decode_token(token: str) -> dict:
+    cached = _decode_cache.get(token)
+    if cached is not None:
+        payload, exp = cached
+        # time() is the epoch directly; utcnow().timestamp() reinterprets
+        # a naive datetime through the local zone and drifts off-UTC hosts
+        if time() < exp:
+            return payload
+        del _decode_cache[token]
+
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
+        payload = jwt.decode(token, _SECRET_KEY_BYTES, algorithms=[settings.ALGORITHM])
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
-        )
\ No newline at end of file
+        )
+
+    exp = payload.get("exp")
+    if exp is not None:
+        if len(_decode_cache) >= _DECODE_CACHE_MAX:
+            # Drop the oldest entry (insertion-ordered dict) to stay bounded
+            del _decode_cache[next(iter(_decode_cache))]
+        _decode_cache[token] = (payload, exp)
+
+    return payload
\ No newline at end of file
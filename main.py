@@ -1,32 +1,73 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+from hashlib import sha256
+from pathlib import Path
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 from core.config import settings
 from api.db.session import async_engine
 from api.v1.models.base import Base
 from api.v1.routes import api_version_one
+from api.v1.services.audit_queue import start_audit_consumer, stop_audit_consumer
+
+# Dev-only guard for create_all: even a no-op create_all round-trips one
+# information_schema probe per table, which adds up on every reload. The
+# fingerprint covers table and index DDL (CreateTable omits Index
+# objects, so index changes must be hashed separately), so unchanged
+# models skip the DB entirely.
+_SCHEMA_HASH_FILE = Path(".schema.hash")
+_DDL_DIALECT = postgresql.dialect()
+
+def _schema_fingerprint() -> str:
+    parts = []
+    for _, table in sorted(Base.metadata.tables.items()):
+        parts.append(str(CreateTable(table).compile(dialect=_DDL_DIALECT)))
+        parts.extend(sorted(
+            str(CreateIndex(index).compile(dialect=_DDL_DIALECT))
+            for index in table.indexes
+        ))
+    return sha256("\n".join(parts).encode()).hexdigest()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     print("Starting up...")
-    
+
     # Create tables (for development only - remove in production)
     if settings.DEBUG:
-        async with async_engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-    
+        fingerprint = _schema_fingerprint()
+        cached = (
+            _SCHEMA_HASH_FILE.read_text().strip()
+            if _SCHEMA_HASH_FILE.exists()
+            else None
+        )
+        if fingerprint != cached:
+            async with async_engine.begin() as conn:
+                # pg_trgm backs the taxpayer search index
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                await conn.run_sync(Base.metadata.create_all)
+            _SCHEMA_HASH_FILE.write_text(fingerprint)
+
+    start_audit_consumer()
+
     yield
-    
+
     # Shutdown
     print("Shutting down...")
+    await stop_audit_consumer()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     debug=settings.DEBUG,
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes UUIDs/datetimes/enums in C; large list responses
+    # (GET /taxpayers pages) encode several times faster than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 # CORS
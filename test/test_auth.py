@@ -1,8 +1,11 @@
 import asyncio
 import uuid
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from api.db.session import AsyncSessionLocal
+from api.v1.models.user import User
 from api.v1.services.user_service import UserService, OrganizationService
+from core.security import hash_password_async
 from api.v1.schemas.user import (
     UserCreate,
     OrganizationCreate,
@@ -30,8 +33,10 @@ async def test_auth():
         organization = await OrganizationService.create(db, org_data)
         print(f"Created organization: {organization.name} (ID: {organization.id})")
         
-        # 2. Create an admin user
-        print("\n2. Creating admin user...")
+        # 2-3. Seed both users in one multi-row INSERT ... RETURNING
+        # (SQLAlchemy batches the parameter sets into a single statement)
+        # instead of two service calls with a commit each
+        print("\n2. Creating admin and accountant users...")
         admin_data = UserCreate(
             name="Admin User",
             email="admin@testfirm.com",
@@ -39,12 +44,6 @@ async def test_auth():
             role=UserRole.ADMIN,
             organization_id=organization.id
         )
-        
-        admin_user = await UserService.create(db, admin_data)
-        print(f"Created admin user: {admin_user.email}")
-        
-        # 3. Create an accountant user
-        print("\n3. Creating accountant user...")
         accountant_data = UserCreate(
             name="Accountant User",
             email="accountant@testfirm.com",
@@ -52,8 +51,24 @@ async def test_auth():
             role=UserRole.ACCOUNTANT,
             organization_id=organization.id
         )
-        
-        accountant = await UserService.create(db, accountant_data)
+
+        rows = []
+        for user_data in (admin_data, accountant_data):
+            rows.append(
+                {
+                    **user_data.model_dump(exclude={"password"}),
+                    "password_hash": await hash_password_async(user_data.password),
+                }
+            )
+
+        # sort_by_parameter_order pins RETURNING rows to parameter order;
+        # insertmanyvalues makes no ordering guarantee without it
+        result = await db.execute(
+            insert(User).returning(User, sort_by_parameter_order=True), rows
+        )
+        admin_user, accountant = result.scalars().all()
+        await db.commit()
+        print(f"Created admin user: {admin_user.email}")
         print(f"Created accountant: {accountant.email}")
         
         # 4. Test getting users
@@ -68,10 +68,9 @@ async def test_taxpayer_api():
             employer_id=org_id
         )
         
-        taxpayer1 = await TaxpayerService.create(db, individual_tp, user)
-        print(f"Created individual taxpayer: {taxpayer1.full_name} (TIN: {taxpayer1.tin})")
-        
-        # 4. Create company taxpayer (CIT)
+        # Created concurrently with the company taxpayer below — the two
+        # inserts are independent, so wall-clock is max() not sum(). Each
+        # task gets its own session; AsyncSession is not concurrency-safe.
         print("\n4. Creating company taxpayer (CIT)...")
         company_tp = TaxpayerCreate(
             full_name="Jane Smith",
@@ -93,7 +92,15 @@ async def test_taxpayer_api():
             }
         )
         
-        taxpayer2 = await TaxpayerService.create(db, company_tp, user)
+        async def create_in_own_session(tp_data):
+            async with AsyncSessionLocal() as task_db:
+                return await TaxpayerService.create(task_db, tp_data, user)
+
+        taxpayer1, taxpayer2 = await asyncio.gather(
+            create_in_own_session(individual_tp),
+            create_in_own_session(company_tp),
+        )
+        print(f"Created individual taxpayer: {taxpayer1.full_name} (TIN: {taxpayer1.tin})")
         print(f"Created company taxpayer: {taxpayer2.business_name} (RC: {taxpayer2.rc_number})")
         
         # 5. Test getting taxpayer by ID
@@ -131,15 +138,26 @@ async def test_taxpayer_api():
             status=TaxpayerStatus.ACTIVE
         )
         
-        taxpayers, total = await TaxpayerService.get_all(db, filter_data, user)
+        # Filter query and stats aggregate are independent reads; run them
+        # concurrently on separate sessions
+        print("\n9. Getting taxpayer statistics...")
+
+        async def get_all_in_own_session():
+            async with AsyncSessionLocal() as task_db:
+                return await TaxpayerService.get_all(task_db, filter_data, user)
+
+        async def get_stats_in_own_session():
+            async with AsyncSessionLocal() as task_db:
+                return await TaxpayerService.get_stats(task_db, user, org_id)
+
+        (taxpayers, total), stats = await asyncio.gather(
+            get_all_in_own_session(),
+            get_stats_in_own_session(),
+        )
         print(f"Found {total} taxpayers matching filters")
-        
+
         for tp in taxpayers:
-            print(f"  - {tp.full_name} ({tp.tax_type.value})")
-        
-        # 9. Test stats
-        print("\n9. Getting taxpayer statistics...")
-        stats = await TaxpayerService.get_stats(db, user, org_id)
+            print(f"  - {tp.full_name} ({tp.tax_type})")
         print(f"Total taxpayers: {stats['total']}")
         print(f"Verified: {stats['verified']}")
         print(f"By tax type: {stats['by_tax_type']}")